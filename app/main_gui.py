@@ -15,6 +15,11 @@ sys.path.insert(0, str(Path(__file__).parent))
 # Import the main dashboard class from the new structure
 from modules.dashboard import FreqTradeDashboard
 
+# ttk theme and the options of the custom button style, applied once per Tk interpreter
+THEME = 'clam'
+ACCENT_BUTTON_OPTIONS = {'foreground': 'white', 'background': '#0078d4'}
+ACCENT_BUTTON_MAP = {'background': [('active', '#106ebe')]}
+
 
 def main():
     """Main function to run the dashboard GUI."""
@@ -22,12 +27,13 @@ def main():
         root = tk.Tk()
 
         # Configure ttk styles
-        style = ttk.Style()
-        style.theme_use('clam')  # Use a modern theme
+        style = ttk.Style(root)
+        if style.theme_use() != THEME:
+            style.theme_use(THEME)  # Use a modern theme
 
         # Configure custom styles
-        style.configure('Accent.TButton', foreground='white', background='#0078d4')
-        style.map('Accent.TButton', background=[('active', '#106ebe')])
+        style.configure('Accent.TButton', **ACCENT_BUTTON_OPTIONS)
+        style.map('Accent.TButton', **ACCENT_BUTTON_MAP)
 
         # Create and run the dashboard
         app = FreqTradeDashboard(root)
@@ -9,12 +9,47 @@ from tkinter import ttk, messagebox, filedialog
 import sqlite3
 import json
 import logging
+import os
+import threading
+from functools import lru_cache
+from itertools import count, repeat
 from abc import ABC, abstractmethod
 from typing import Optional, Callable, Dict, Any
 from pathlib import Path
 
 from ..results_database_manager import DatabaseManager
 
+# orjson is optional; it speeds up parsing and pretty-printing large config and result payloads
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_loads(text):
+    """Parse JSON text, using orjson when available."""
+    if orjson:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _json_dumps_indented(data) -> str:
+    """Serialize data as JSON indented by two spaces, using orjson when available."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(data, indent=2)
+
+
+@lru_cache(maxsize=64)
+def _load_config_cached(path_str: str, mtime_ns: int) -> str:
+    """Read a config file and return it pretty-printed. mtime_ns is part of the key so edits invalidate it."""
+    with open(path_str, 'rb') as f:
+        return _json_dumps_indented(_json_loads(f.read()))
+
+
+# Units used by format_file_size, each 1024 times the previous one
+_SIZE_NAMES = ("B", "KB", "MB", "GB")
+
 
 class AbstractTab(ABC):
     """
@@ -22,6 +57,9 @@ class AbstractTab(ABC):
     Contains shared functionality and defines the interface that all tabs must implement.
     """
 
+    # Characters inserted into a text widget at a time by fill_text
+    TEXT_CHUNK_SIZE = 64 * 1024
+
     def __init__(self, parent, db_manager: DatabaseManager, logger: logging.Logger):
         """
         Initialize the abstract tab.
@@ -214,6 +252,32 @@ class AbstractTab(ABC):
         import tkinter.scrolledtext as scrolledtext
         return scrolledtext.ScrolledText(parent, wrap=wrap, font=font)
 
+    def fill_text(self, text_widget: tk.Text, content: str):
+        """
+        Replace the content of a text widget.
+
+        Large content is inserted in chunks of TEXT_CHUNK_SIZE characters with the
+        event loop running in between, so the UI stays responsive. Filling the widget
+        again stops the remaining chunks of the previous content.
+
+        Args:
+            text_widget: Text widget to fill
+            content: New content of the widget
+        """
+        text_widget.delete(1.0, tk.END)
+        generation = getattr(text_widget, '_fill_generation', 0) + 1
+        text_widget._fill_generation = generation
+
+        def insert_chunk(start: int):
+            if text_widget._fill_generation != generation:
+                return
+            end = start + self.TEXT_CHUNK_SIZE
+            text_widget.insert(tk.END, content[start:end])
+            if end < len(content):
+                text_widget.after(1, insert_chunk, end)
+
+        insert_chunk(0)
+
     def create_treeview(self, parent, columns: tuple, show: str = 'headings',
                         selectmode: str = 'browse') -> ttk.Treeview:
         """
@@ -316,6 +380,32 @@ class AbstractTab(ABC):
             self.show_error("Error", f"Failed to load file: {e}")
             return None
 
+    def load_config_text(self, config_path: Optional[str]) -> str:
+        """
+        Return the pretty-printed content of a config file for display.
+
+        Parsed configs are cached on path and modification time, so clicking through
+        results that share a config only reads the file once.
+
+        Args:
+            config_path: Path to the config file
+
+        Returns:
+            str: Formatted config, or a message when it is missing or invalid
+        """
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns if config_path else None
+        except OSError:
+            mtime_ns = None
+        if mtime_ns is None:
+            return "Configuration file not found."
+
+        try:
+            return _load_config_cached(config_path, mtime_ns)
+        except Exception as e:
+            self.logger.error(f"Failed to load JSON file {config_path}: {e}")
+            return "Failed to load config."
+
     def save_json_file(self, file_path: str, data: Dict) -> bool:
         """
         Save data to a JSON file.
@@ -336,25 +426,31 @@ class AbstractTab(ABC):
             self.show_error("Error", f"Failed to save file: {e}")
             return False
 
-    def execute_database_query(self, query: str, params: tuple = None) -> Optional[list]:
+    def execute_database_query(self, query: str, params: tuple = None, as_tuples: bool = False) -> Optional[list]:
         """
         Execute a database query and return results.
 
         Args:
             query: SQL query string
             params: Query parameters
+            as_tuples: Return plain tuples instead of sqlite3.Row objects
 
         Returns:
             Optional[list]: Query results or None if failed
         """
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
-                conn.row_factory = sqlite3.Row
+            with self.db_manager.read() as conn:
+                if not as_tuples:
+                    conn.row_factory = sqlite3.Row
                 cursor = conn.execute(query, params or ())
                 return cursor.fetchall()
         except Exception as e:
             self.logger.error(f"Database query failed: {e}")
-            self.show_error("Database Error", f"Query failed: {e}")
+            if threading.current_thread() is threading.main_thread():
+                self.show_error("Database Error", f"Query failed: {e}")
+            else:
+                # Queries may run on worker threads; dialogs must be shown from the Tk thread
+                self.frame.after(0, lambda error=e: self.show_error("Database Error", f"Query failed: {error}"))
             return None
 
     def format_percentage(self, value: float, decimals: int = 2) -> str:
@@ -372,6 +468,20 @@ class AbstractTab(ABC):
             return "N/A"
         return f"{value:+.{decimals}f}%"
 
+    @staticmethod
+    def sql_format_percentage(expression: str, decimals: int = 2) -> str:
+        """
+        Build an SQL expression that formats a value like format_percentage does.
+
+        Args:
+            expression: SQL expression of the value to format
+            decimals: Number of decimal places
+
+        Returns:
+            str: SQL expression giving the formatted percentage string
+        """
+        return f"CASE WHEN {expression} IS NULL THEN 'N/A' ELSE printf('%+.{decimals}f%%', {expression}) END"
+
     def format_number(self, value: float, decimals: int = 2) -> str:
         """
         Format a number with specified decimal places.
@@ -400,12 +510,10 @@ class AbstractTab(ABC):
         if size_bytes == 0:
             return "0 B"
 
-        size_names = ["B", "KB", "MB", "GB"]
-        import math
-        i = int(math.floor(math.log(size_bytes, 1024)))
-        p = math.pow(1024, i)
-        s = round(size_bytes / p, 2)
-        return f"{s} {size_names[i]}"
+        # Each unit is 10 more bits; sizes beyond the largest unit are shown in that unit
+        i = min((size_bytes.bit_length() - 1) // 10, len(_SIZE_NAMES) - 1)
+        s = round(size_bytes / (1 << (10 * i)), 2)
+        return f"{s} {_SIZE_NAMES[i]}"
 
     def truncate_text(self, text: str, max_length: int = 50) -> str:
         """
@@ -435,7 +543,7 @@ class AbstractTab(ABC):
             tuple[bool, Optional[str]]: (is_valid, error_message)
         """
         try:
-            json.loads(text)
+            _json_loads(text)
             return True, None
         except json.JSONDecodeError as e:
             return False, str(e)
@@ -478,8 +586,36 @@ class AbstractTab(ABC):
         Args:
             tree: Treeview widget to clear
         """
-        for item in tree.get_children():
-            tree.delete(item)
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+
+    def insert_treeview_rows(self, tree: ttk.Treeview, rows: list, tags: list = None, index='end'):
+        """
+        Insert many rows into a treeview in one batch.
+
+        The scroll command is detached while inserting so the scrollbar is
+        updated once for the whole batch instead of once per row.
+
+        Args:
+            tree: Treeview widget
+            rows: List of value tuples, one per row
+            tags: Optional list of tag tuples, one per row
+            index: Position of the first inserted row, 'end' to append the rows
+        """
+        positions = repeat('end') if index == 'end' else count(index)
+        yscrollcommand = tree.cget('yscrollcommand')
+        tree.configure(yscrollcommand='')
+        try:
+            insert = tree.insert
+            if tags is None:
+                for values, position in zip(rows, positions):
+                    insert('', position, values=values)
+            else:
+                for values, row_tags, position in zip(rows, tags, positions):
+                    insert('', position, values=values, tags=row_tags)
+        finally:
+            tree.configure(yscrollcommand=yscrollcommand)
 
     def populate_combobox(self, combobox: ttk.Combobox, values: list, default_value: str = None):
         """
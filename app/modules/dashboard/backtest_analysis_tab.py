@@ -7,9 +7,8 @@ Displays and manages backtest results.
 import tkinter as tk
 from tkinter import ttk
 import json
-from pathlib import Path
 
-from .abstract_tab import AbstractTab
+from .abstract_tab import AbstractTab, _json_loads, _json_dumps_indented
 
 
 class BacktestAnalysisTab(AbstractTab):
@@ -17,6 +16,9 @@ class BacktestAnalysisTab(AbstractTab):
     A dedicated tab for analyzing backtest results and reality gap.
     """
 
+    # Results queries keyed by (has_strategy, has_timeframe)
+    _results_queries = {}
+
     def __init__(self, parent, db_manager, logger):
         """Initialize the Backtest Analysis tab."""
         super().__init__(parent, db_manager, logger)
@@ -142,64 +144,88 @@ class BacktestAnalysisTab(AbstractTab):
         if selected_item:
             self.load_result_details(selected_item['values'][0])
 
-    def load_strategies_filter(self):
-        """Load strategy names for the filter dropdown."""
-        query = "SELECT DISTINCT strategy_name FROM backtest_results ORDER BY strategy_name"
-        results = self.execute_database_query(query)
-        options = ["All Strategies"] + [row['strategy_name'] for row in results] if results else []
-        self.populate_combobox(self.strategy_combo, options, "All Strategies")
+    def load_filter_options(self):
+        """Load strategy names and timeframes for the filter dropdowns in one query."""
+        strategy_options, timeframe_options = self._fetch_filter_options()
+        self.populate_combobox(self.strategy_combo, strategy_options, "All Strategies")
+        self.populate_combobox(self.timeframe_combo, timeframe_options, "All Timeframes")
 
-    def load_timeframes(self):
-        """Load timeframes for the filter dropdown."""
-        query = "SELECT DISTINCT timeframe FROM backtest_results WHERE timeframe IS NOT NULL ORDER BY timeframe"
+    def _fetch_filter_options(self) -> tuple:
+        """Query the strategy and timeframe dropdown options."""
+        query = """
+            SELECT DISTINCT 'strategy' AS kind, strategy_name AS value FROM backtest_results
+            UNION ALL
+            SELECT DISTINCT 'timeframe', timeframe FROM backtest_results WHERE timeframe IS NOT NULL
+            ORDER BY kind, value
+        """
         results = self.execute_database_query(query)
-        options = ["All Timeframes"] + [row['timeframe'] for row in results] if results else []
-        self.populate_combobox(self.timeframe_combo, options, "All Timeframes")
+
+        strategies = [row['value'] for row in results or [] if row['kind'] == 'strategy']
+        timeframes = [row['value'] for row in results or [] if row['kind'] == 'timeframe']
+        return (["All Strategies"] + strategies if strategies else [],
+                ["All Timeframes"] + timeframes if timeframes else [])
 
     def load_backtest_results(self):
         """Load and display backtest results based on current filters."""
-        query = """
-            SELECT b.id, b.strategy_name, b.total_profit_pct AS bt_profit, b.total_trades, b.timestamp,
-                   h.total_profit_pct AS opt_profit
-            FROM backtest_results b
-            LEFT JOIN hyperopt_results h ON b.hyperopt_id = h.id
-            WHERE b.status = 'completed'
-        """
+        self._show_backtest_results(self._fetch_backtest_results(self.strategy_var.get(), self.timeframe_var.get()))
+
+    @classmethod
+    def _build_results_query(cls, has_strategy: bool, has_timeframe: bool) -> str:
+        """Return the results query for a filter combination, building it only once."""
+        key = (has_strategy, has_timeframe)
+        query = cls._results_queries.get(key)
+        if query is None:
+            # Values are formatted for display by SQLite; the gap is only shown with an optimization profit
+            gap = "COALESCE(b.total_profit_pct, 0) - h.total_profit_pct"
+            query = f"""
+                SELECT b.id, b.strategy_name,
+                       {cls.sql_format_percentage('b.total_profit_pct')},
+                       {cls.sql_format_percentage('h.total_profit_pct')},
+                       {cls.sql_format_percentage(gap)},
+                       COALESCE(NULLIF(b.total_trades, 0), 'N/A'),
+                       COALESCE(NULLIF(substr(b.timestamp, 1, 10), ''), 'N/A')
+                FROM backtest_results b
+                LEFT JOIN hyperopt_results h ON b.hyperopt_id = h.id
+                WHERE b.status = 'completed'
+            """
+            if has_strategy:
+                query += " AND b.strategy_name = ?"
+            if has_timeframe:
+                query += " AND b.timeframe = ?"
+            query += " ORDER BY b.total_profit_pct DESC LIMIT 100"
+            cls._results_queries[key] = query
+        return query
+
+    def _fetch_backtest_results(self, strategy: str, timeframe: str):
+        """Query the backtest results matching the given filter values."""
         params = []
 
-        if self.strategy_var.get() != "All Strategies":
-            query += " AND b.strategy_name = ?"
-            params.append(self.strategy_var.get())
-        if self.timeframe_var.get() != "All Timeframes":
-            query += " AND b.timeframe = ?"
-            params.append(self.timeframe_var.get())
+        has_strategy = strategy != "All Strategies"
+        if has_strategy:
+            params.append(strategy)
+        has_timeframe = timeframe != "All Timeframes"
+        if has_timeframe:
+            params.append(timeframe)
 
-        query += " ORDER BY b.total_profit_pct DESC LIMIT 100"
-        results = self.execute_database_query(query, tuple(params))
+        query = self._build_results_query(has_strategy, has_timeframe)
+        return self.execute_database_query(query, tuple(params), as_tuples=True)
 
+    def _show_backtest_results(self, results):
+        """Fill the results list with the given backtest result rows."""
         self.clear_treeview(self.results_tree)
         if results:
-            for row in results:
-                gap = (row['bt_profit'] or 0) - (row['opt_profit'] or 0)
-                self.results_tree.insert('', 'end', values=(
-                    row['id'], row['strategy_name'],
-                    self.format_percentage(row['bt_profit']),
-                    self.format_percentage(row['opt_profit']) if row['opt_profit'] is not None else "N/A",
-                    self.format_percentage(gap) if row['opt_profit'] is not None else "N/A",
-                    row['total_trades'] or "N/A",
-                    row['timestamp'][:10] if row['timestamp'] else "N/A"
-                ))
+            self.insert_treeview_rows(self.results_tree, results)
 
     def load_result_details(self, backtest_id: int):
         """Load the details for a specific backtest result."""
         query = "SELECT * FROM backtest_results WHERE id = ?"
         results = self.execute_database_query(query, (backtest_id,))
         if not results: return
-        result = results[0]
+        result = dict(results[0])
 
         # Update metrics
         for key, label in self.metrics_labels.items():
-            value = result[key] if key in result.keys() else None
+            value = result.get(key)
             if isinstance(value, float) and ('_pct' in key or 'rate' in key):
                 formatted = self.format_percentage(value)
             elif isinstance(value, float):
@@ -209,28 +235,32 @@ class BacktestAnalysisTab(AbstractTab):
             label.config(text=str(formatted))
 
         # Load config file content
-        self.config_text.delete(1.0, tk.END)
-        config_path = result['config_file_path']
-        if config_path and Path(config_path).exists():
-            config_data = self.load_json_file(config_path)
-            self.config_text.insert(1.0, json.dumps(config_data, indent=2) if config_data else "Failed to load config.")
-        else:
-            self.config_text.insert(1.0, "Configuration file not found.")
+        self.fill_text(self.config_text, self.load_config_text(result['config_file_path']))
 
         # Load backtest log
-        self.backtest_text.delete(1.0, tk.END)
         if result['backtest_json']:
             try:
-                backtest_data = json.loads(result['backtest_json'])
-                raw_output = backtest_data.get('raw_output', json.dumps(backtest_data, indent=2))
-                self.backtest_text.insert(1.0, raw_output)
+                backtest_data = _json_loads(result['backtest_json'])
+                raw_output = backtest_data.get('raw_output') or _json_dumps_indented(backtest_data)
+                self.fill_text(self.backtest_text, raw_output)
             except (json.JSONDecodeError, TypeError):
-                self.backtest_text.insert(1.0, result['backtest_json'])
+                self.fill_text(self.backtest_text, result['backtest_json'])
         else:
-            self.backtest_text.insert(1.0, "Backtest log not found.")
+            self.fill_text(self.backtest_text, "Backtest log not found.")
+
+    def fetch_refresh_data(self) -> tuple:
+        """Run the queries behind refresh_data without touching any widgets."""
+        # Refreshing resets the filters to "All", so the results are queried unfiltered
+        return (*self._fetch_filter_options(),
+                self._fetch_backtest_results("All Strategies", "All Timeframes"))
+
+    def apply_refresh_data(self, data: tuple):
+        """Show the data returned by fetch_refresh_data."""
+        strategy_options, timeframe_options, results = data
+        self.populate_combobox(self.strategy_combo, strategy_options, "All Strategies")
+        self.populate_combobox(self.timeframe_combo, timeframe_options, "All Timeframes")
+        self._show_backtest_results(results)
 
     def refresh_data(self):
         """Refresh all data displays in this tab."""
-        self.load_strategies_filter()
-        self.load_timeframes()
-        self.load_backtest_results()
\ No newline at end of file
+        self.apply_refresh_data(self.fetch_refresh_data())
\ No newline at end of file
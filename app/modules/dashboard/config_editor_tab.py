@@ -9,7 +9,7 @@ from tkinter import ttk
 import json
 from pathlib import Path
 
-from .abstract_tab import AbstractTab
+from .abstract_tab import AbstractTab, _json_loads
 
 
 class ConfigEditorTab(AbstractTab):
@@ -205,14 +205,12 @@ class ConfigEditorTab(AbstractTab):
         try:
             content = self.config_editor.get(1.0, tk.END)
 
-            try:
-                json.loads(content)
-            except json.JSONDecodeError as e:
-                if not self.ask_yes_no("Invalid JSON", f"The JSON is invalid: {e}\n\nDo you want to save anyway?"):
+            is_valid, error_message = self.validate_json_text(content)
+            if not is_valid:
+                if not self.ask_yes_no("Invalid JSON", f"The JSON is invalid: {error_message}\n\nDo you want to save anyway?"):
                     return False
 
-            with open(self.current_config_file, 'w') as f:
-                f.write(content)
+            self._write_config_file(self.current_config_file, content)
 
             self.config_modified = False
             self._update_title()
@@ -224,6 +222,12 @@ class ConfigEditorTab(AbstractTab):
             self.show_error("Error", f"Failed to save file: {e}")
             return False
 
+    def _write_config_file(self, file_path: str, content: str):
+        """Write the editor content to a file, encoded to UTF-8 once and written unbuffered."""
+        data = content.encode('utf-8')
+        with open(file_path, 'wb', buffering=0) as f:
+            f.write(data)
+
     def _save_config_as(self) -> bool:
         """Save configuration as a new file."""
         file_path = self.browse_save_file(
@@ -237,14 +241,12 @@ class ConfigEditorTab(AbstractTab):
             try:
                 content = self.config_editor.get(1.0, tk.END)
 
-                try:
-                    json.loads(content)
-                except json.JSONDecodeError as e:
-                    if not self.ask_yes_no("Invalid JSON", f"The JSON is invalid: {e}\n\nDo you want to save anyway?"):
+                is_valid, error_message = self.validate_json_text(content)
+                if not is_valid:
+                    if not self.ask_yes_no("Invalid JSON", f"The JSON is invalid: {error_message}\n\nDo you want to save anyway?"):
                         return False
 
-                with open(file_path, 'w') as f:
-                    f.write(content)
+                self._write_config_file(file_path, content)
 
                 self.current_config_file = file_path
                 self.config_modified = False
@@ -304,9 +306,11 @@ class ConfigEditorTab(AbstractTab):
         """Format the JSON in the editor."""
         try:
             content = self.config_editor.get(1.0, tk.END)
-            is_valid, error_message = self.validate_json_text(content)
-            if is_valid:
-                parsed_json = json.loads(content)
+            try:
+                parsed_json = _json_loads(content)
+            except json.JSONDecodeError as e:
+                self.show_error("Format Error", f"Cannot format invalid JSON: {e}")
+            else:
                 formatted_json = json.dumps(parsed_json, indent=2, sort_keys=False)
                 cursor_pos = self.config_editor.index(tk.INSERT)
                 self.config_editor.delete(1.0, tk.END)
@@ -317,8 +321,6 @@ class ConfigEditorTab(AbstractTab):
                     pass
                 self._on_text_modified()
                 self.show_info("Success", "JSON formatted successfully!")
-            else:
-                self.show_error("Format Error", f"Cannot format invalid JSON: {error_message}")
         except Exception as e:
             self.show_error("Error", f"Formatting failed: {e}")
 
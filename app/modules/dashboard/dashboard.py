@@ -5,7 +5,6 @@ This file contains the main FreqTradeDashboard class that assembles all the tabs
 and manages the overall application state.
 """
 
-import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
@@ -32,9 +31,16 @@ from .logs_tab import LogsTab
 class FreqTradeDashboard:
     """Main dashboard application class that orchestrates all the UI tabs."""
 
+    # Delay before refreshing results after an execution; completions within it share one refresh
+    RESULTS_REFRESH_DELAY_MS = 250
+
     def __init__(self, root: tk.Tk):
         """Initialize the main dashboard application."""
         self.root = root
+
+        # Pending results refresh and the database file state it last saw
+        self._results_refresh_pending = False
+        self._results_db_state = None
         self.root.title("FreqTrade Optimization Dashboard")
         self.root.geometry("1200x800")
 
@@ -150,7 +156,7 @@ class FreqTradeDashboard:
         tab_callbacks = {
             'get_executor': lambda: self.executor,
             'get_freqtrade_path': lambda: self.freqtrade_path,
-            'refresh_results_data': self.results_tab.refresh_data,
+            'refresh_results_data': self.refresh_results_data,
             'show_download_dialog': self.show_download_data_dialog,  # Updated to accept config_data parameter
         }
 
@@ -166,6 +172,39 @@ class FreqTradeDashboard:
                 output_callback=self.execution_tab.append_output,
                 completion_callback=self.execution_tab._on_execution_complete
             )
+
+    def refresh_results_data(self):
+        """Schedule a refresh of the results tab after an execution, unless one is already pending."""
+        if self._results_refresh_pending:
+            return
+        self._results_refresh_pending = True
+        self.root.after(self.RESULTS_REFRESH_DELAY_MS, self._refresh_results_if_changed)
+
+    def _refresh_results_if_changed(self):
+        """Refresh the results tab, bypassing cached queries, if the results database was written to."""
+        self._results_refresh_pending = False
+
+        db_state = self._get_results_db_state()
+        if db_state is not None and db_state == self._results_db_state:
+            return
+
+        # Only remember the state once a refresh has started; a deferred one must not be skipped next time
+        self.results_tab.invalidate_cache()
+        if self.results_tab.refresh_data():
+            self._results_db_state = db_state
+
+    def _get_results_db_state(self):
+        """Return the size and modification time of the results database and its WAL file."""
+        state = []
+        for path in (self.db_manager.db_path, f"{self.db_manager.db_path}-wal"):
+            try:
+                file_stat = os.stat(path)
+            except OSError:
+                state.append(None)
+                continue
+            state.append((file_stat.st_size, file_stat.st_mtime_ns))
+        return tuple(state)
+
     def refresh_all_data(self):
         """Refresh the data in all tabs."""
         for tab in [self.results_tab, self.data_tab, self.config_tab, self.execution_tab, self.logs_tab]:
@@ -234,12 +273,18 @@ class FreqTradeDashboard:
         timeframes_frame.pack(fill='x', pady=(0, 10))
         timeframe_vars = {}
         timeframes = ['1m', '5m', '15m', '30m', '1h', '4h', '1d']
+        # Mirrors the checkbuttons so starting the download doesn't query Tk
+        selected_timeframe_set = {tf for tf in timeframes if tf in default_timeframes}
+
+        def toggle_timeframe(tf):
+            selected_timeframe_set.symmetric_difference_update((tf,))
 
         for i, tf in enumerate(timeframes):
-            var = tk.BooleanVar(value=(tf in default_timeframes))
+            var = tk.BooleanVar(value=(tf in selected_timeframe_set))
             timeframe_vars[tf] = var
-            ttk.Checkbutton(timeframes_frame, text=tf, variable=var).grid(row=i // 4, column=i % 4, sticky='w',
-                                                                          padx=(0, 10))
+            ttk.Checkbutton(timeframes_frame, text=tf, variable=var,
+                            command=lambda tf=tf: toggle_timeframe(tf)).grid(row=i // 4, column=i % 4,
+                                                                             sticky='w', padx=(0, 10))
 
         # Days of history
         ttk.Label(main_frame, text="Days of history:").pack(anchor='w')
@@ -247,12 +292,15 @@ class FreqTradeDashboard:
         ttk.Entry(main_frame, textvariable=days_var).pack(fill='x', pady=(0, 20))
 
         def start_download():
-            selected_timeframes = [tf for tf, var in timeframe_vars.items() if var.get()]
+            selected_timeframes = [tf for tf in timeframes if tf in selected_timeframe_set]
             pairs = [p.strip() for p in pairs_var.get().split(',') if p.strip()]
 
             if not self.executor:
                 messagebox.showerror("Error", "Executor is not initialized.")
                 return
+            if self.execution_tab.is_execution_running():
+                messagebox.showerror("Error", "A command is still running. Stop it or wait for it to finish first.")
+                return
             if not selected_timeframes:
                 messagebox.showerror("Error", "Please select at least one timeframe.")
                 return
@@ -270,13 +318,9 @@ class FreqTradeDashboard:
 
             # Switch to execution tab and run download
             self.notebook.select(3)
-            import threading
-            threading.Thread(
-                target=self.executor.download_data,
-                args=(exchange_var.get(), pairs, selected_timeframes),
-                kwargs={'days': days},
-                daemon=True
-            ).start()
+            self.execution_tab.submit_execution(
+                self.executor.download_data, exchange_var.get(), pairs, selected_timeframes, days=days
+            )
 
         # Buttons frame
         button_frame = ttk.Frame(main_frame)
@@ -291,5 +335,7 @@ class FreqTradeDashboard:
         """
         self.logger.info("Performing cleanup before application exit...")
         self.logs_tab.cleanup()
+        self.results_tab.cleanup()
+        self.execution_tab.cleanup()
         if self.executor:
             self.executor.stop_execution()
\ No newline at end of file
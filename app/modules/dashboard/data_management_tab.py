@@ -7,18 +7,67 @@ Handles the data management functionality of the dashboard.
 import tkinter as tk
 from tkinter import ttk
 import json
+import os
+import queue
+import re
+import sys
+import threading
+from collections import defaultdict
+from itertools import compress
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from .abstract_tab import AbstractTab
 
+# Start of an OHLCV row and its timestamp, e.g. "[1609459200000,"
+_OHLCV_ROW_RE = re.compile(rb'\[\s*(-?\d+(?:\.\d+)?)')
+
+# Common data file name: base and quote currency, optionally followed by the timeframe, e.g. "BTC_USDT-5m"
+_DATA_FILE_NAME_RE = re.compile(r'(?P<base>[A-Za-z0-9]+)_(?P<quote>[A-Za-z0-9]+)(?:-(?P<timeframe>[A-Za-z0-9]+))?')
+
+# Quote currencies recognized at the end of pairs without a separator, most common first
+_QUOTE_CURRENCIES = ('USDT', 'BTC', 'ETH', 'BNB', 'USD', 'EUR', 'BUSD')
+
+# Timeframes shown by the "Hour+" quick filter
+_HOURLY_TIMEFRAMES = frozenset({'1h', '4h', '1d', '1w', '12h', '6h', '8h'})
+
 
 class DataManagementTab(AbstractTab):
     """
     Tab for managing FreqTrade data files.
     """
 
+    # Exchanges with their own data tab; data of all other exchanges is shown in the "other" tab
+    KNOWN_EXCHANGES = ("binance", "kraken", "coinbase")
+
+    # Number of rows added to a data table at a time; more are added when scrolled to the bottom
+    PAGE_ROWS = 200
+
+    # Maximum number of rows kept in a data table; rows scrolled far out of view are removed
+    RENDER_WINDOW_ROWS = 5 * PAGE_ROWS
+
+    # Block size used when scanning data files, and how much of the file end is read for the last row
+    SCAN_CHUNK_SIZE = 1 << 20
+    SCAN_TAIL_SIZE = 4096
+
+    # How often scan results are moved from the background scan into the data tables, and how many per pass
+    SCAN_DRAIN_MS = 50
+    SCAN_DRAIN_ITEMS = 200
+
+    # Number of threads reading and analyzing data files in parallel during a scan
+    SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+    # Number of threads deleting selected data files in parallel
+    DELETE_WORKERS = 8
+
+    # Filters matching a column exactly; rows are indexed by the values of these columns
+    INDEXED_FILTERS = (('timeframe_var', 3), ('base_currency_var', 1), ('quote_currency_var', 2))
+
+    # Delay before the search text is applied, so typing does not re-filter on every key
+    FILTER_DEBOUNCE_MS = 150
+
     def __init__(self, parent, db_manager, logger):
         """Initialize the Data Management tab."""
         super().__init__(parent, db_manager, logger)
@@ -31,6 +80,17 @@ class DataManagementTab(AbstractTab):
         self.exchange_frames = {}
         self.exchange_trees = {}
 
+        # Data file summaries stored in the database, and those computed during the current scan
+        self._file_summaries = {}
+        self._updated_summaries = []
+
+        # Filter widgets of the exchange tab being built, bound once its table exists
+        self._pending_filter_bindings = {}
+
+        # Results of the background data scan, drained into the data tables on the main thread
+        self._scan_queue = queue.Queue()
+        self._scanning = False
+
     def create_tab(self) -> ttk.Frame:
         """Create the data management tab."""
         self.frame = ttk.Frame(self.parent)
@@ -64,7 +124,7 @@ class DataManagementTab(AbstractTab):
         self.data_notebook.pack(fill='both', expand=True, padx=10, pady=(0, 10))
 
         # Initialize with common exchanges
-        exchanges = ["binance", "kraken", "coinbase", "other"]
+        exchanges = [*self.KNOWN_EXCHANGES, "other"]
         for exchange in exchanges:
             self._create_exchange_tab(exchange)
 
@@ -202,16 +262,21 @@ class DataManagementTab(AbstractTab):
 
         tree.grid(row=0, column=0, sticky='nsew')
         if 'vertical' in scrollbars:
-            scrollbars['vertical'].grid(row=0, column=1, sticky='ns')
+            v_scrollbar = scrollbars['vertical']
+            v_scrollbar.grid(row=0, column=1, sticky='ns')
+            # Watch the scroll position to add further rows once the top or bottom is reached
+            tree.configure(yscrollcommand=lambda first, last: self._on_tree_scroll(tree, v_scrollbar, first, last))
         if 'horizontal' in scrollbars:
             scrollbars['horizontal'].grid(row=1, column=0, sticky='ew')
 
         # Store tree reference and initialize data storage
         self.exchange_trees[exchange_name] = tree
-        tree._all_data = []  # Store all data for filtering
+        self._reset_data_rows(tree)
+        tree._render_pending = False
+        tree._filter_after_id = None
 
         # Bind filter events now that tree is created
-        if hasattr(self, '_pending_filter_bindings') and exchange_name in self._pending_filter_bindings:
+        if exchange_name in self._pending_filter_bindings:
             bindings = self._pending_filter_bindings[exchange_name]
             filter_vars = bindings['filter_vars']
 
@@ -220,7 +285,7 @@ class DataManagementTab(AbstractTab):
                 setattr(tree, var_name, var)
 
             # Bind events
-            bindings['search_entry'].bind('<KeyRelease>', lambda e: self._apply_filters(exchange_name))
+            bindings['search_entry'].bind('<KeyRelease>', lambda e: self._schedule_filters(exchange_name))
             bindings['timeframe_combo'].bind('<<ComboboxSelected>>', lambda e: self._apply_filters(exchange_name))
             bindings['base_currency_combo'].bind('<<ComboboxSelected>>', lambda e: self._apply_filters(exchange_name))
             bindings['quote_currency_combo'].bind('<<ComboboxSelected>>', lambda e: self._apply_filters(exchange_name))
@@ -235,6 +300,9 @@ class DataManagementTab(AbstractTab):
             self.data_status_var.set("FreqTrade path not configured")
             return
 
+        if self._scanning:
+            return
+
         try:
             self.data_status_var.set("Scanning data files...")
 
@@ -245,36 +313,85 @@ class DataManagementTab(AbstractTab):
                 self.data_status_var.set("Data directory not found")
                 return
 
-            # Scan each exchange directory
-            for exchange_name, tree in self.exchange_trees.items():
-                self._load_exchange_data(exchange_name, tree, data_base_dir)
+            # Clear existing items and stored data
+            for tree in self.exchange_trees.values():
+                self.clear_treeview(tree)
+                self._reset_data_rows(tree)
 
-            self.data_status_var.set("Data scan completed")
+            # Scan the files in the background; the results are added to the tables as they come in
+            self._scanning = True
+            threading.Thread(
+                target=self._scan_data_files,
+                args=(data_base_dir, list(self.exchange_trees)),
+                daemon=True
+            ).start()
+            self.frame.after(self.SCAN_DRAIN_MS, self._drain_scan_queue)
 
         except Exception as e:
             self.logger.error(f"Error refreshing data info: {e}")
             self.data_status_var.set("Error scanning data")
             self.show_error("Error", f"Failed to refresh data: {e}")
 
-    def _load_exchange_data(self, exchange_name: str, tree, data_base_dir: Path):
-        """Load data files for a specific exchange."""
-        # Clear existing items and stored data
-        self.clear_treeview(tree)
-        tree._all_data = []
+    def _scan_data_files(self, data_base_dir: Path, exchange_names: List[str]):
+        """Scan the data files of all exchanges. Runs in a background thread."""
+        try:
+            self._file_summaries = self.db_manager.get_data_file_summaries()
+            self._updated_summaries = []
 
-        exchange_dirs = []
+            # List the exchange directories once for all tabs
+            with os.scandir(data_base_dir) as entries:
+                data_dirs = {entry.name: entry.path for entry in entries if entry.is_dir()}
 
+            # Scan each exchange directory
+            for exchange_name in exchange_names:
+                self._load_exchange_data(exchange_name, data_dirs)
+
+            if self._updated_summaries:
+                self.db_manager.save_data_file_summaries(self._updated_summaries)
+
+            self._scan_queue.put(('done', None, None))
+
+        except Exception as e:
+            self.logger.error(f"Error refreshing data info: {e}")
+            self._scan_queue.put(('error', None, e))
+
+    def _drain_scan_queue(self):
+        """Move results of the background scan into the data tables."""
+        for _ in range(self.SCAN_DRAIN_ITEMS):
+            try:
+                kind, exchange_name, payload = self._scan_queue.get_nowait()
+            except queue.Empty:
+                break
+
+            if kind == 'row':
+                self._append_data_row(self.exchange_trees[exchange_name], *payload)
+            elif kind == 'loaded':
+                tree = self.exchange_trees[exchange_name]
+                self._display_filtered_data(tree)
+
+                # Update summary
+                loaded_files, total_files = payload
+                tree.summary_var.set(f"Loaded {loaded_files} of {total_files} data files")
+            elif kind == 'done':
+                self._scanning = False
+                self.data_status_var.set("Data scan completed")
+                return
+            elif kind == 'error':
+                self._scanning = False
+                self.data_status_var.set("Error scanning data")
+                self.show_error("Error", f"Failed to refresh data: {payload}")
+                return
+
+        self.frame.after(self.SCAN_DRAIN_MS, self._drain_scan_queue)
+
+    def _load_exchange_data(self, exchange_name: str, data_dirs: Dict[str, str]):
+        """Load data files for a specific exchange and queue them for display."""
         if exchange_name == "other":
             # For "other" tab, scan all directories except known exchanges
-            known_exchanges = ["binance", "kraken", "coinbase"]
-            for item in data_base_dir.iterdir():
-                if item.is_dir() and item.name not in known_exchanges:
-                    exchange_dirs.append(item)
+            exchange_dirs = [path for name, path in data_dirs.items() if name not in self.KNOWN_EXCHANGES]
         else:
             # For specific exchange
-            exchange_dir = data_base_dir / exchange_name
-            if exchange_dir.exists():
-                exchange_dirs.append(exchange_dir)
+            exchange_dirs = [data_dirs[exchange_name]] if exchange_name in data_dirs else []
 
         total_files = 0
         loaded_files = 0
@@ -282,74 +399,92 @@ class DataManagementTab(AbstractTab):
         for exchange_dir in exchange_dirs:
             try:
                 # Scan for JSON files (FreqTrade data format)
-                json_files = list(exchange_dir.rglob("*.json"))
+                json_files = list(self._iter_json_files(exchange_dir))
                 total_files += len(json_files)
 
-                for json_file in json_files:
-                    try:
-                        # Parse filename to extract pair and timeframe
-                        file_stem = json_file.stem
-
-                        # Handle different naming conventions
-                        if '-' in file_stem:
-                            parts = file_stem.rsplit('-', 1)
-                            if len(parts) == 2:
-                                pair, timeframe = parts
-                                pair = pair.replace('_', '/')
-                            else:
-                                pair = file_stem
-                                timeframe = "unknown"
-                        else:
-                            pair = file_stem.replace('_', '/')
-                            timeframe = "unknown"
-
-                        # Extract base and quote currencies from pair
-                        base_currency, quote_currency = self._parse_pair(pair)
-                        if '/' not in pair and base_currency != "Unknown":
-                            pair = f"{base_currency}/{quote_currency}"
-
-                        # Get file info
-                        file_stat = json_file.stat()
-                        file_size = self.format_file_size(file_stat.st_size)
-                        last_modified = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M')
-
-                        # Try to get data range and record count
-                        start_date, end_date, record_count = self._analyze_data_file(json_file)
-
-                        values = (
-                            pair,
-                            base_currency,
-                            quote_currency,
-                            timeframe,
-                            start_date,
-                            end_date,
-                            record_count,
-                            file_size,
-                            last_modified
-                        )
-
-                        # Store data for filtering
-                        tree._all_data.append({
-                            'values': values,
-                            'file_path': str(json_file),
-                            'visible': True
-                        })
-
-                        loaded_files += 1
-
-                    except Exception as e:
-                        self.logger.warning(f"Error processing file {json_file}: {e}")
-                        continue
+                with ThreadPoolExecutor(max_workers=self.SCAN_WORKERS) as executor:
+                    for row in executor.map(lambda json_file: self._process_data_file(*json_file), json_files):
+                        if row:
+                            self._scan_queue.put(('row', exchange_name, row))
+                            loaded_files += 1
 
             except Exception as e:
                 self.logger.error(f"Error scanning exchange directory {exchange_dir}: {e}")
                 continue
 
-        self._display_filtered_data(tree)
+        self._scan_queue.put(('loaded', exchange_name, (loaded_files, total_files)))
 
-        # Update summary
-        if hasattr(tree, 'summary_var'):
-            tree.summary_var.set(f"Loaded {loaded_files} of {total_files} data files")
+    def _iter_json_files(self, directory):
+        """Yield the path and stat result of every JSON file below a directory."""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self._iter_json_files(entry.path)
+                elif entry.name.endswith('.json') and entry.is_file():
+                    yield entry.path, entry.stat()
+
+    def _process_data_file(self, json_file: str, file_stat: os.stat_result) -> Optional[tuple]:
+        """Build the table row of a data file. Runs in a scan worker thread."""
+        try:
+            # Parse filename to extract pair and timeframe
+            file_stem = os.path.splitext(os.path.basename(json_file))[0]
+            pair, base_currency, quote_currency, timeframe = self._parse_data_file_name(file_stem)
+
+            # Repeated filter values share one string object
+            base_currency, quote_currency, timeframe = (
+                sys.intern(base_currency), sys.intern(quote_currency), sys.intern(timeframe))
+
+            # Get file info
+            file_size = self.format_file_size(file_stat.st_size)
+            last_modified = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M')
+
+            # Try to get data range and record count
+            start_date, end_date, record_count = self._get_data_file_summary(json_file, file_stat)
+
+            values = (
+                pair,
+                base_currency,
+                quote_currency,
+                timeframe,
+                start_date,
+                end_date,
+                record_count,
+                file_size,
+                last_modified
+            )
+
+            return values, json_file
+
+        except Exception as e:
+            self.logger.warning(f"Error processing file {json_file}: {e}")
+            return None
+
+    def _parse_data_file_name(self, file_stem: str) -> tuple[str, str, str, str]:
+        """Get the pair, base currency, quote currency and timeframe from a data file name."""
+        match = _DATA_FILE_NAME_RE.fullmatch(file_stem)
+        if match:
+            base_currency, quote_currency, timeframe = match.group('base', 'quote', 'timeframe')
+            return f"{base_currency}/{quote_currency}", base_currency, quote_currency, timeframe or "unknown"
+
+        # Handle different naming conventions
+        if '-' in file_stem:
+            parts = file_stem.rsplit('-', 1)
+            if len(parts) == 2:
+                pair, timeframe = parts
+                pair = pair.replace('_', '/')
+            else:
+                pair = file_stem
+                timeframe = "unknown"
+        else:
+            pair = file_stem.replace('_', '/')
+            timeframe = "unknown"
+
+        # Extract base and quote currencies from pair
+        base_currency, quote_currency = self._parse_pair(pair)
+        if '/' not in pair and base_currency != "Unknown":
+            pair = f"{base_currency}/{quote_currency}"
+
+        return pair, base_currency, quote_currency, timeframe
 
     def _parse_pair(self, pair: str) -> tuple[str, str]:
         """Parse a trading pair to extract base and quote currencies."""
@@ -361,7 +496,7 @@ class DataManagementTab(AbstractTab):
         quote_currency = "Unknown"
 
         # Try to guess common separations
-        for quote in ['USDT', 'BTC', 'ETH', 'BNB', 'USD', 'EUR', 'BUSD']:
+        for quote in _QUOTE_CURRENCIES:
             if pair.endswith(quote):
                 base_currency = pair[:-len(quote)]
                 quote_currency = quote
@@ -369,22 +504,40 @@ class DataManagementTab(AbstractTab):
 
         return base_currency, quote_currency
 
-    def _analyze_data_file(self, file_path: Path) -> tuple[str, str, str]:
+    def _get_data_file_summary(self, file_path: str, file_stat) -> tuple[str, str, str]:
+        """Get the date range and record count of a data file, reusing the stored summary while the file is unchanged."""
+        path = str(file_path)
+        cached = self._file_summaries.get(path)
+        if cached and cached[0] == file_stat.st_mtime and cached[1] == file_stat.st_size:
+            return cached[2], cached[3], str(cached[4])
+
+        start_date, end_date, record_count = self._analyze_data_file(file_path)
+        if record_count != "Error":
+            self._updated_summaries.append(
+                (path, file_stat.st_mtime, file_stat.st_size, start_date, end_date, int(record_count))
+            )
+        return start_date, end_date, record_count
+
+    def _analyze_data_file(self, file_path: str) -> tuple[str, str, str]:
         """Analyze a data file to get date range and record count."""
         try:
-            data = self.load_json_file(str(file_path))
-
-            if not data:
-                return "No data", "No data", "0"
+            scanned = self._scan_ohlcv_file(file_path)
+            if scanned:
+                first_timestamp, last_timestamp, record_count = scanned
+            else:
+                # Not a plain OHLCV array; parse the whole file (errors are logged below, this runs off the main thread)
+                with open(file_path, 'r') as f:
+                    data = json.load(f)
 
-            # Data is typically in OHLCV format: [timestamp, open, high, low, close, volume]
-            record_count = len(data)
+                if not data:
+                    return "No data", "No data", "0"
 
-            if record_count > 0:
-                # Get first and last timestamps
+                # Data is typically in OHLCV format: [timestamp, open, high, low, close, volume]
+                record_count = len(data)
                 first_timestamp = data[0][0] if data[0] else None
                 last_timestamp = data[-1][0] if data[-1] else None
 
+            if record_count > 0:
                 if first_timestamp and last_timestamp:
                     start_date = datetime.fromtimestamp(first_timestamp / 1000).strftime('%Y-%m-%d')
                     end_date = datetime.fromtimestamp(last_timestamp / 1000).strftime('%Y-%m-%d')
@@ -396,63 +549,241 @@ class DataManagementTab(AbstractTab):
             self.logger.warning(f"Error analyzing data file {file_path}: {e}")
             return "Error", "Error", "Error"
 
-    def _display_filtered_data(self, tree):
-        """Display filtered data in the treeview."""
+    def _scan_ohlcv_file(self, file_path: str) -> Optional[tuple]:
+        """
+        Get the first and last timestamps and the row count of an OHLCV JSON file without parsing it.
+
+        Rows are counted by their opening brackets, read in blocks. Returns None when the
+        file does not start like an OHLCV array.
+        """
+        with open(file_path, 'rb') as f:
+            head = f.read(self.SCAN_CHUNK_SIZE)
+
+            # The first row starts at the second bracket
+            outer_start = head.find(b'[')
+            first_row_start = head.find(b'[', outer_start + 1) if outer_start != -1 else -1
+            first = _OHLCV_ROW_RE.match(head, first_row_start) if first_row_start != -1 else None
+            if not first:
+                return None
+
+            bracket_count = head.count(b'[')
+            for chunk in iter(lambda: f.read(self.SCAN_CHUNK_SIZE), b''):
+                bracket_count += chunk.count(b'[')
+
+            # The last row starts at the last bracket
+            f.seek(max(0, f.tell() - self.SCAN_TAIL_SIZE))
+            tail = f.read()
+            last_row_start = tail.rfind(b'[')
+            last = _OHLCV_ROW_RE.match(tail, last_row_start) if last_row_start != -1 else None
+            if not last:
+                return None
+
+        return float(first.group(1)), float(last.group(1)), bracket_count - 1
+
+    def _display_filtered_data(self, tree, visible_rows: Optional[List[int]] = None):
+        """Display filtered data in the treeview, starting with the first page of rows."""
         # Clear current display
         self.clear_treeview(tree)
 
-        # Add visible items
-        for data_item in tree._all_data:
-            if data_item['visible']:
-                tree.insert('', 'end', values=data_item['values'], tags=(data_item['file_path'],))
+        if visible_rows is None:
+            visible_rows = list(compress(range(len(tree._visible)), tree._visible))
+        tree._visible_rows = visible_rows
+        tree._first_rendered = 0
+        tree._rendered = 0
+        self._render_next_rows(tree)
+
+    def _render_next_rows(self, tree):
+        """
+        Insert the next page of visible rows at the bottom of the treeview, tagged with their row id.
+
+        Once the tree holds more than RENDER_WINDOW_ROWS rows, the rows at the top are removed.
+        """
+        rows = tree._visible_rows[tree._rendered:tree._rendered + self.PAGE_ROWS]
+        top_row = self._get_top_row(tree)
+        self.insert_treeview_rows(tree, [tree._values[row_id] for row_id in rows],
+                                  [(str(row_id),) for row_id in rows])
+        tree._rendered += len(rows)
+
+        excess = tree._rendered - tree._first_rendered - self.RENDER_WINDOW_ROWS
+        if excess > 0:
+            tree.delete(*tree.get_children()[:excess])
+            tree._first_rendered += excess
+            self._scroll_to_row(tree, top_row - excess)
+        tree._render_pending = False
+
+    def _render_earlier_rows(self, tree):
+        """
+        Insert the page of visible rows before the first rendered row at the top of the treeview.
+
+        Once the tree holds more than RENDER_WINDOW_ROWS rows, the rows at the bottom are removed.
+        """
+        new_first = max(0, tree._first_rendered - self.PAGE_ROWS)
+        rows = tree._visible_rows[new_first:tree._first_rendered]
+        top_row = self._get_top_row(tree)
+        self.insert_treeview_rows(tree, [tree._values[row_id] for row_id in rows],
+                                  [(str(row_id),) for row_id in rows], index=0)
+        tree._first_rendered = new_first
+
+        excess = tree._rendered - tree._first_rendered - self.RENDER_WINDOW_ROWS
+        if excess > 0:
+            tree.delete(*tree.get_children()[-excess:])
+            tree._rendered -= excess
+
+        # Keep the row that was at the top in view
+        self._scroll_to_row(tree, top_row + len(rows))
+        tree._render_pending = False
+
+    def _get_top_row(self, tree) -> int:
+        """Return the position of the top row in view among the rows in the treeview."""
+        return round(float(tree.yview()[0]) * len(tree.get_children()))
+
+    def _scroll_to_row(self, tree, position: int):
+        """Scroll the treeview so the row at the given position is at the top."""
+        row_count = len(tree.get_children())
+        if row_count:
+            tree.yview_moveto(max(0, position) / row_count)
+
+    def _on_tree_scroll(self, tree, scrollbar, first, last):
+        """Update the scrollbar and add more rows once the top or bottom of the tree is reached."""
+        scrollbar.set(first, last)
+        if tree._render_pending:
+            return
+        if float(last) >= 1.0 and tree._rendered < len(tree._visible_rows):
+            tree._render_pending = True
+            tree.after_idle(self._render_next_rows, tree)
+        elif float(first) <= 0.0 and tree._first_rendered > 0:
+            tree._render_pending = True
+            tree.after_idle(self._render_earlier_rows, tree)
+
+    def _reset_data_rows(self, tree):
+        """
+        Reset the data rows stored in a tree for filtering.
+
+        Rows are stored column-wise and addressed by their row id: the displayed values,
+        the file path, the upper-cased pair for searching and a visibility flag.
+        """
+        tree._values = []
+        tree._paths = []
+        tree._search_keys = []
+        tree._visible = bytearray()
+        tree._visible_rows = []  # Ids of the rows passing the filters, in display order
+        tree._first_rendered = 0  # Position in _visible_rows of the first row in the tree
+        tree._rendered = 0  # Position in _visible_rows after the last row in the tree
+        tree._index = self._create_filter_index()  # Row ids by filter column value
+        tree._last_filter = None  # Exact-match values, search text and matching row ids of the last filter
+        tree._filter_active = False  # Whether the filters hide any rows
+
+    def _append_data_row(self, tree, values: tuple, file_path: str):
+        """Store a new, visible data row in a tree."""
+        row_id = len(tree._values)
+        tree._values.append(values)
+        tree._paths.append(file_path)
+        tree._search_keys.append(values[0].upper())
+        tree._visible.append(1)
+        self._index_data_row(tree, row_id, values)
+        tree._last_filter = None
+
+    def _remove_data_rows(self, tree, file_paths: set):
+        """Remove the rows of the given files from a tree's stored data."""
+        kept = [row_id for row_id, path in enumerate(tree._paths) if path not in file_paths]
+        new_ids = {old_id: new_id for new_id, old_id in enumerate(kept)}
+
+        tree._values = [tree._values[row_id] for row_id in kept]
+        tree._paths = [tree._paths[row_id] for row_id in kept]
+        tree._search_keys = [tree._search_keys[row_id] for row_id in kept]
+        tree._visible = bytearray(tree._visible[row_id] for row_id in kept)
+        tree._visible_rows = [new_ids[row_id] for row_id in tree._visible_rows if row_id in new_ids]
+
+        tree._index = self._create_filter_index()
+        for row_id, values in enumerate(tree._values):
+            self._index_data_row(tree, row_id, values)
+        tree._last_filter = None
+
+    def _create_filter_index(self) -> Dict[str, defaultdict]:
+        """Create an empty index of row ids by the values of the exact-match filter columns."""
+        return {var_name: defaultdict(list) for var_name, _ in self.INDEXED_FILTERS}
+
+    def _index_data_row(self, tree, row_id: int, values: tuple):
+        """Add a data row to the filter index."""
+        for var_name, column in self.INDEXED_FILTERS:
+            tree._index[var_name][values[column]].append(row_id)
+
+    def _schedule_filters(self, exchange_name: str):
+        """Apply the filters once typing in the search box pauses."""
+        tree = self.exchange_trees[exchange_name]
+        if tree._filter_after_id:
+            tree.after_cancel(tree._filter_after_id)
+        tree._filter_after_id = tree.after(self.FILTER_DEBOUNCE_MS, self._apply_filters, exchange_name)
 
     def _apply_filters(self, exchange_name: str):
         """Apply all filters to the exchange data display."""
         tree = self.exchange_trees[exchange_name]
+        tree._filter_after_id = None
 
         # Get filter values
         search_text = tree.search_var.get().upper()
-        timeframe_filter = tree.timeframe_var.get()
-        base_currency_filter = tree.base_currency_var.get()
-        quote_currency_filter = tree.quote_currency_var.get()
-
-        visible_count = 0
-        total_count = len(tree._all_data)
-
-        # Apply filters to stored data
-        for data_item in tree._all_data:
-            values = data_item['values']
-            if not values or len(values) < 9:
-                data_item['visible'] = False
-                continue
+        exact_values = tuple(getattr(tree, var_name).get() for var_name, _ in self.INDEXED_FILTERS)
 
-            pair, base_currency, quote_currency, timeframe, start_date, end_date, records, file_size, last_modified = values
+        total_count = len(tree._values)
 
-            # Apply filters
-            show_item = True
-
-            if search_text and search_text not in pair.upper():
-                show_item = False
-            if timeframe_filter != "All" and timeframe != timeframe_filter:
-                show_item = False
-            if base_currency_filter != "All" and base_currency != base_currency_filter:
-                show_item = False
-            if quote_currency_filter != "All" and quote_currency != quote_currency_filter:
-                show_item = False
+        last_filter = tree._last_filter
+        if last_filter and last_filter[0] == exact_values and last_filter[1] in search_text:
+            # The search text was extended, so only the rows of the last search can still match
+            candidates = last_filter[2]
+        else:
+            # Narrow the rows down to those matching all exact-match filters, starting with the smallest set
+            row_id_sets = [
+                set(tree._index[var_name].get(value, ()))
+                for (var_name, _), value in zip(self.INDEXED_FILTERS, exact_values)
+                if value != "All"
+            ]
+            if row_id_sets:
+                row_id_sets.sort(key=len)
+                candidates = sorted(row_id_sets[0].intersection(*row_id_sets[1:]))
+            else:
+                candidates = range(total_count)
 
-            data_item['visible'] = show_item
-            if show_item:
-                visible_count += 1
+        # Only the remaining rows are searched
+        if search_text:
+            search_keys = tree._search_keys
+            visible_rows = [row_id for row_id in candidates if search_text in search_keys[row_id]]
+        else:
+            visible_rows = list(candidates)
+        visible_count = len(visible_rows)
+        tree._last_filter = (exact_values, search_text, visible_rows)
+        tree._filter_active = visible_count < total_count
+
+        # Only rows shown before or after filtering change their visibility
+        visible = tree._visible
+        for row_id in tree._visible_rows:
+            visible[row_id] = 0
+        for row_id in visible_rows:
+            visible[row_id] = 1
 
         # Update display
-        self._display_filtered_data(tree)
+        self._display_filtered_data(tree, visible_rows)
 
         # Update summary
-        if hasattr(tree, 'summary_var'):
-            if visible_count == total_count:
-                tree.summary_var.set(f"Showing all {total_count} data files")
-            else:
-                tree.summary_var.set(f"Showing {visible_count} of {total_count} data files")
+        if visible_count == total_count:
+            tree.summary_var.set(f"Showing all {total_count} data files")
+        else:
+            tree.summary_var.set(f"Showing {visible_count} of {total_count} data files")
+
+    def _set_filters(self, tree, quote_currency: str = 'All'):
+        """
+        Set all filter variables of a tree at once, before the caller filters the rows once.
+
+        A search filter still waiting for typing to pause is dropped, so it cannot run
+        another pass over the rows afterwards or replace the caller's result.
+        """
+        if tree._filter_after_id:
+            tree.after_cancel(tree._filter_after_id)
+            tree._filter_after_id = None
+
+        tree.search_var.set('')
+        tree.timeframe_var.set('All')
+        tree.base_currency_var.set('All')
+        tree.quote_currency_var.set(quote_currency)
 
     def _apply_quick_filter(self, exchange_name: str, filter_type: str):
         """Apply predefined quick filters."""
@@ -460,46 +791,33 @@ class DataManagementTab(AbstractTab):
 
         if filter_type == 'hourly':
             # Show only hourly and higher timeframes
-            tree.timeframe_var.set('All')
-            tree.base_currency_var.set('All')
-            tree.quote_currency_var.set('All')
-            tree.search_var.set('')
-
-            # Custom filter for hourly+
-            hourly_timeframes = ['1h', '4h', '1d', '1w', '12h', '6h', '8h']
-
-            visible_count = 0
-            for data_item in tree._all_data:
-                values = data_item['values']
-                if values and len(values) >= 4:
-                    timeframe = values[3]
-                    if timeframe in hourly_timeframes:
-                        data_item['visible'] = True
-                        visible_count += 1
-                    else:
-                        data_item['visible'] = False
-                else:
-                    data_item['visible'] = False
-
-            self._display_filtered_data(tree)
-
-            if hasattr(tree, 'summary_var'):
-                tree.summary_var.set(f"Showing {visible_count} hourly+ timeframe files")
+            self._set_filters(tree)
+
+            # Custom filter for hourly+, taken from the timeframe index
+            timeframe_index = tree._index['timeframe_var']
+            visible_rows = sorted(
+                row_id for timeframe in _HOURLY_TIMEFRAMES for row_id in timeframe_index.get(timeframe, ())
+            )
+            visible_count = len(visible_rows)
+
+            tree._visible = bytearray(len(tree._values))
+            for row_id in visible_rows:
+                tree._visible[row_id] = 1
+
+            tree._filter_active = visible_count < len(tree._values)
+
+            self._display_filtered_data(tree, visible_rows)
+
+            tree.summary_var.set(f"Showing {visible_count} hourly+ timeframe files")
 
         elif filter_type == 'btc_pairs':
             # Show only BTC quote pairs
-            tree.timeframe_var.set('All')
-            tree.base_currency_var.set('All')
-            tree.quote_currency_var.set('BTC')
-            tree.search_var.set('')
+            self._set_filters(tree, quote_currency='BTC')
             self._apply_filters(exchange_name)
 
         elif filter_type == 'usdt_pairs':
             # Show only USDT quote pairs
-            tree.timeframe_var.set('All')
-            tree.base_currency_var.set('All')
-            tree.quote_currency_var.set('USDT')
-            tree.search_var.set('')
+            self._set_filters(tree, quote_currency='USDT')
             self._apply_filters(exchange_name)
 
     def _clear_filters(self, exchange_name: str):
@@ -507,21 +825,21 @@ class DataManagementTab(AbstractTab):
         tree = self.exchange_trees[exchange_name]
 
         # Reset all filter variables
-        tree.search_var.set('')
-        tree.timeframe_var.set('All')
-        tree.base_currency_var.set('All')
-        tree.quote_currency_var.set('All')
+        self._set_filters(tree)
+
+        # All rows are shown already
+        if not tree._filter_active:
+            return
 
         # Show all items
-        for data_item in tree._all_data:
-            data_item['visible'] = True
+        total_count = len(tree._values)
+        tree._visible = bytearray(b'\x01') * total_count
+        tree._filter_active = False
 
-        self._display_filtered_data(tree)
+        self._display_filtered_data(tree, list(range(total_count)))
 
         # Update summary
-        if hasattr(tree, 'summary_var'):
-            total_count = len(tree._all_data)
-            tree.summary_var.set(f"Showing all {total_count} data files")
+        tree.summary_var.set(f"Showing all {total_count} data files")
 
     def _download_new_data(self):
         """Open dialog to download new data."""
@@ -549,26 +867,66 @@ class DataManagementTab(AbstractTab):
                                f"Are you sure you want to delete {len(selected_items)} data file(s)?"):
             return
 
-        deleted_count = 0
+        # Get file paths from the row ids in the tags
+        items_by_path = {}
         for item in selected_items:
-            try:
-                # Get file path from tags
-                tags = tree.item(item)['tags']
-                if tags:
-                    file_path = Path(tags[0])
-                    if file_path.exists():
-                        file_path.unlink()
-                        tree.delete(item)
-                        deleted_count += 1
-            except Exception as e:
-                self.logger.error(f"Error deleting file: {e}")
+            tags = tree.item(item)['tags']
+            if tags:
+                items_by_path[tree._paths[int(tags[0])]] = item
+
+        # Delete the files in the background; the tree is updated once all are done
+        self.data_status_var.set(f"Deleting {len(items_by_path)} files...")
+        threading.Thread(target=self._delete_data_files, args=(tree, items_by_path), daemon=True).start()
+
+    def _delete_data_files(self, tree, items_by_path: Dict[str, str]):
+        """Delete data files in parallel. Runs in a background thread."""
+        paths = list(items_by_path)
+        with ThreadPoolExecutor(max_workers=self.DELETE_WORKERS) as executor:
+            deleted = list(executor.map(self._unlink_data_file, paths))
 
+        deleted_items = {path: items_by_path[path] for path, ok in zip(paths, deleted) if ok}
+        self.frame.after(0, self._on_data_files_deleted, tree, deleted_items)
+
+    def _unlink_data_file(self, path: str) -> bool:
+        """Delete one data file, returning whether it was deleted."""
+        try:
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.error(f"Error deleting file: {e}")
+            return False
+
+    def _on_data_files_deleted(self, tree, deleted_items: Dict[str, str]):
+        """Remove deleted data files from the tree and report the result."""
+        deleted_count = len(deleted_items)
         if deleted_count > 0:
+            # The rows may already be gone if the data was refreshed meanwhile
+            items = [item for item in deleted_items.values() if tree.exists(item)]
+            if items:
+                tree.delete(*items)
+
+            # Rows removed from the tree while the files were deleted may lie before the rendered rows
+            deleted_paths = set(deleted_items)
+            deleted_before = sum(1 for row_id in tree._visible_rows[:tree._first_rendered]
+                                 if tree._paths[row_id] in deleted_paths)
+
+            # Forget the deleted files so later filtering and paging do not show them again
+            self._remove_data_rows(tree, deleted_paths)
+
+            # Row ids shifted; the rows in the tree are the visible rows from the first rendered one
+            children = tree.get_children()
+            tree._first_rendered -= deleted_before
+            tree._rendered = tree._first_rendered + len(children)
+            for item, row_id in zip(children, tree._visible_rows[tree._first_rendered:]):
+                tree.item(item, tags=(str(row_id),))
+
             self.show_info("Success", f"Deleted {deleted_count} file(s) successfully!")
             self.data_status_var.set(f"Deleted {deleted_count} files")
             # Update summary after deletion
-            if hasattr(tree, 'summary_var'):
-                remaining_count = len(tree.get_children())
-                tree.summary_var.set(f"Showing {remaining_count} data files")
+            remaining_count = len(tree._visible_rows)
+            tree.summary_var.set(f"Showing {remaining_count} data files")
         else:
-            self.show_error("Error", "No files were deleted!")
\ No newline at end of file
+            self.data_status_var.set("Ready")
+            self.show_error("Error", "No files were deleted!")
@@ -4,9 +4,13 @@ Execution Tab
 Handles the execution functionality of the dashboard.
 """
 import json
+import os
 import tkinter as tk
 from tkinter import ttk
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .abstract_tab import AbstractTab
@@ -17,6 +21,23 @@ class ExecutionTab(AbstractTab):
     Tab for executing FreqTrade commands (hyperopt, backtest, etc.).
     """
 
+    # Maximum number of lines kept in the output display; older lines are trimmed
+    MAX_OUTPUT_LINES = 5000
+
+    # Output text is collected and inserted into the display at most this often (ms)
+    OUTPUT_FLUSH_MS = 33
+
+    # Hyperopt spaces and their bit in the selection mask
+    SPACES = ('buy', 'sell', 'roi', 'stoploss')
+    SPACE_BITS = {space: 1 << i for i, space in enumerate(SPACES)}
+
+    # Seconds a successful config file existence check is reused
+    EXISTS_CACHE_TTL = 2.0
+
+    # Number of commands that can run at the same time; the executor runs one command at a time,
+    # so a new run is refused while one is still going
+    EXECUTION_WORKERS = 1
+
     def __init__(self, parent, db_manager, logger):
         """Initialize the Execution tab."""
         super().__init__(parent, db_manager, logger)
@@ -29,8 +50,9 @@ class ExecutionTab(AbstractTab):
         self.exec_hyperfunction_var = tk.StringVar(value="SharpeHyperOptLoss")
         self.progress_var = tk.StringVar(value="Ready")
 
-        # Hyperopt spaces
+        # Hyperopt spaces; the mask mirrors the checkbuttons so runs don't query Tk
         self.spaces_vars = {}
+        self._spaces_mask = 0
 
         # Widgets
         self.exec_strategy_combo = None
@@ -38,8 +60,22 @@ class ExecutionTab(AbstractTab):
         self.progress_bar = None
         self.output_text = None
 
-        # Execution state
-        self.execution_thread = None
+        # Output waiting to be inserted into the display and the latest progress message waiting
+        # to be shown; both are appended to from the executor thread and applied by _flush_output
+        self._output_buffer = deque()
+        self._progress_buffer = deque(maxlen=1)
+        self._output_flush_pending = False
+
+        # Execution state; commands run on long-lived worker threads instead of a new thread each
+        self._execution_pool = ThreadPoolExecutor(max_workers=self.EXECUTION_WORKERS,
+                                                  thread_name_prefix='execution')
+        self.execution_future = None
+
+        # Config paths recently found on disk, mapped to the time of the check
+        self._exists_cache = {}
+
+        # Strategies directory, its modification time and the strategy names found in it
+        self._strategy_cache = None
 
     def create_tab(self) -> ttk.Frame:
         """Create the execution tab."""
@@ -118,14 +154,19 @@ class ExecutionTab(AbstractTab):
         spaces_frame = ttk.Frame(params_frame)
         spaces_frame.pack(fill='x', pady=(0, 10))
 
-        spaces = ['buy', 'sell', 'roi', 'stoploss']
-        for i, space in enumerate(spaces):
+        for i, space in enumerate(self.SPACES):
             var = tk.BooleanVar(value=True)
             self.spaces_vars[space] = var
-            ttk.Checkbutton(spaces_frame, text=space.title(), variable=var).grid(
+            self._spaces_mask |= self.SPACE_BITS[space]
+            ttk.Checkbutton(spaces_frame, text=space.title(), variable=var,
+                            command=lambda s=space: self._toggle_space(s)).grid(
                 row=i // 2, column=i % 2, sticky='w'
             )
 
+    def _toggle_space(self, space: str):
+        """Flip a hyperopt space in the selection mask (called by its checkbutton)."""
+        self._spaces_mask ^= self.SPACE_BITS[space]
+
     def _create_execution_buttons(self, parent):
         """Create the execution buttons section."""
         buttons_frame = self.create_labeled_frame(parent, "Execution")
@@ -155,24 +196,43 @@ class ExecutionTab(AbstractTab):
         output_frame.grid_rowconfigure(0, weight=1)
         output_frame.grid_columnconfigure(0, weight=1)
 
-        self.output_text = self.create_scrolled_text(output_frame, wrap=tk.WORD, font=('Consolas', 9))
+        # Output lines are not wrapped, since rewrapping slows down streaming long output,
+        # so a horizontal scrollbar is added
+        self.output_text = self.create_scrolled_text(output_frame, wrap=tk.NONE, font=('Consolas', 9))
         self.output_text.grid(row=0, column=0, sticky='nsew')
+        h_scrollbar = ttk.Scrollbar(output_frame, orient='horizontal', command=self.output_text.xview)
+        self.output_text.config(xscrollcommand=h_scrollbar.set)
+        h_scrollbar.grid(row=1, column=0, sticky='ew')
 
     def _load_strategies(self):
-        """Load strategies for execution combo box."""
-        try:
-            freqtrade_path = self.call_callback('get_freqtrade_path')
-            if not freqtrade_path:
-                return
+        """Load strategies for execution combo box without blocking the UI."""
+        freqtrade_path = self.call_callback('get_freqtrade_path')
+        if not freqtrade_path:
+            return
 
-            strategies_dir = Path(freqtrade_path) / "user_data" / "strategies"
-            if strategies_dir.exists():
-                strategies = []
-                for file in strategies_dir.glob("*.py"):
-                    if not file.name.startswith("__"):
-                        strategies.append(file.stem)
+        threading.Thread(target=self._scan_strategies, args=(freqtrade_path,), daemon=True).start()
 
-                self.populate_combobox(self.exec_strategy_combo, sorted(strategies))
+    def _scan_strategies(self, freqtrade_path: str):
+        """Scan the strategies directory in a worker thread and hand the list to the main thread."""
+        try:
+            strategies_dir = os.path.join(freqtrade_path, "user_data", "strategies")
+            if os.path.isdir(strategies_dir):
+                # Adding, removing or renaming a strategy changes the directory's modification time
+                mtime_ns = os.stat(strategies_dir).st_mtime_ns
+                cached = self._strategy_cache
+                if cached and cached[0] == strategies_dir and cached[1] == mtime_ns:
+                    strategies = cached[2]
+                else:
+                    # DirEntry.is_file() is answered from the directory listing for regular files
+                    with os.scandir(strategies_dir) as entries:
+                        strategies = sorted(
+                            entry.name[:-3] for entry in entries
+                            if entry.name.endswith('.py') and not entry.name.startswith('__')
+                            and entry.is_file()
+                        )
+                    self._strategy_cache = (strategies_dir, mtime_ns, strategies)
+
+                self.frame.after(0, lambda: self.populate_combobox(self.exec_strategy_combo, strategies))
 
         except Exception as e:
             self.logger.error(f"Error loading strategies: {e}")
@@ -190,7 +250,7 @@ class ExecutionTab(AbstractTab):
 
     def _run_hyperopt(self):
         """Run hyperopt optimization."""
-        if not self._validate_execution_params():
+        if self._execution_busy() or not self._validate_execution_params():
             return
 
         strategy = self.exec_strategy_var.get()
@@ -200,7 +260,7 @@ class ExecutionTab(AbstractTab):
         hyperfunction = self.exec_hyperfunction_var.get()
 
         # Get selected spaces
-        selected_spaces = [space for space, var in self.spaces_vars.items() if var.get()]
+        selected_spaces = [space for space in self.SPACES if self._spaces_mask & self.SPACE_BITS[space]]
         if not selected_spaces:
             self.show_error("Error", "Please select at least one hyperopt space!")
             return
@@ -212,6 +272,8 @@ class ExecutionTab(AbstractTab):
             return
 
         # Clear output and start execution
+        self._output_buffer.clear()
+        self._progress_buffer.clear()
         self.output_text.delete(1.0, tk.END)
         self.progress_bar.start()
 
@@ -238,13 +300,11 @@ class ExecutionTab(AbstractTab):
                 error_msg = f"Error running hyperopt: {e}"
                 self.frame.after(0, lambda: self._execution_error(error_msg))
 
-        self.execution_thread = threading.Thread(target=run_in_thread)
-        self.execution_thread.daemon = True
-        self.execution_thread.start()
+        self.submit_execution(run_in_thread)
 
     def _run_backtest(self):
         """Run backtest."""
-        if not self._validate_execution_params():
+        if self._execution_busy() or not self._validate_execution_params():
             return
 
         strategy = self.exec_strategy_var.get()
@@ -252,6 +312,8 @@ class ExecutionTab(AbstractTab):
         timerange = self.exec_timerange_var.get()
 
         # Clear output and start execution
+        self._output_buffer.clear()
+        self._progress_buffer.clear()
         self.output_text.delete(1.0, tk.END)
         self.progress_bar.start()
 
@@ -275,9 +337,35 @@ class ExecutionTab(AbstractTab):
                 error_msg = f"Error running backtest: {e}"
                 self.frame.after(0, lambda: self._execution_error(error_msg))
 
-        self.execution_thread = threading.Thread(target=run_in_thread)
-        self.execution_thread.daemon = True
-        self.execution_thread.start()
+        self.submit_execution(run_in_thread)
+
+    def submit_execution(self, function, *args, **kwargs):
+        """
+        Run a command function on an execution worker thread.
+
+        Args:
+            function: Function to run
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            Future: Future of the function's result, or None if a command is still running
+        """
+        if self._execution_busy():
+            return None
+        self.execution_future = self._execution_pool.submit(function, *args, **kwargs)
+        return self.execution_future
+
+    def is_execution_running(self) -> bool:
+        """Return whether a submitted command has not finished yet."""
+        return self.execution_future is not None and not self.execution_future.done()
+
+    def _execution_busy(self) -> bool:
+        """Tell the user and return True if a command is still running."""
+        if not self.is_execution_running():
+            return False
+        self.show_info("Execution Running", "A command is still running. Stop it or wait for it to finish first.")
+        return True
 
     def _download_data(self):
         """Download market data with config pre-fill if available."""
@@ -344,21 +432,36 @@ class ExecutionTab(AbstractTab):
             self.show_error("Error", "Please select a configuration file!")
             return False
 
-        if config_file and not Path(config_file).exists():
+        if config_file and not self._config_exists(config_file):
             self.show_error("Error", f"Configuration file not found: {config_file}")
             return False
 
         return True
 
+    def _config_exists(self, config_file: str) -> bool:
+        """Check that a config file exists, reusing recent positive results."""
+        now = time.monotonic()
+        checked_at = self._exists_cache.get(config_file)
+        if checked_at is not None and now - checked_at < self.EXISTS_CACHE_TTL:
+            return True
+
+        if os.path.exists(config_file):
+            self._exists_cache[config_file] = now
+            return True
+
+        self._exists_cache.pop(config_file, None)
+        return False
+
     def _on_execution_complete(self, result):
         """Handle execution completion."""
+        self._progress_buffer.clear()
         self.progress_bar.stop()
 
         if result.success:
             message = "Command completed successfully!"
-            if hasattr(result, 'hyperopt_id') and result.hyperopt_id:
+            if result.hyperopt_id:
                 message += f" (Hyperopt DB record: {result.hyperopt_id})"
-            elif hasattr(result, 'backtest_id') and result.backtest_id:
+            elif result.backtest_id:
                 message += f" (Backtest DB record: {result.backtest_id})"
 
             self.progress_var.set(message)
@@ -373,19 +476,69 @@ class ExecutionTab(AbstractTab):
 
     def _execution_error(self, message: str):
         """Handle execution error."""
+        self._progress_buffer.clear()
         self.progress_var.set("Error")
         self.progress_bar.stop()
         self._append_output(f"\n✗ {message}\n")
         self.show_error("Execution Error", message)
 
     def _append_output(self, text: str):
-        """Append text to output display."""
+        """Append text to output display; text arriving close together is inserted at once."""
+        if not text:
+            return
+        self._output_buffer.append(text)
+        self._schedule_output_flush()
+
+    def _schedule_output_flush(self):
+        """Schedule _flush_output unless it is already scheduled."""
+        if not self._output_flush_pending:
+            self._output_flush_pending = True
+            self.frame.after(self.OUTPUT_FLUSH_MS, self._flush_output)
+
+    def _flush_output(self):
+        """Show the latest progress message and insert the buffered output text into the output display."""
+        self._output_flush_pending = False
+        try:
+            self.progress_var.set(self._progress_buffer.pop())
+        except IndexError:
+            pass
+
+        chunks = []
+        while self._output_buffer:
+            chunks.append(self._output_buffer.popleft())
+        if not chunks:
+            return
+
+        text = ''.join(chunks)
+        # Lines beyond the display limit would be trimmed right after inserting them
+        if text.count('\n') > self.MAX_OUTPUT_LINES:
+            text = ''.join(text.splitlines(keepends=True)[-self.MAX_OUTPUT_LINES:])
+
+        # Follow the output only while the end is in view, so reading earlier output is not interrupted
+        at_end = self.output_text.yview()[1] >= 1.0
         self.output_text.insert(tk.END, text)
-        self.output_text.see(tk.END)
+        self._trim_output()
+        if at_end:
+            self.output_text.see(tk.END)
+
+    def _trim_output(self):
+        """Drop the oldest lines so the output display stays within MAX_OUTPUT_LINES."""
+        line_count = int(self.output_text.index('end-1c').split('.')[0])
+        if line_count > self.MAX_OUTPUT_LINES:
+            self.output_text.delete('1.0', f'{line_count - self.MAX_OUTPUT_LINES + 1}.0')
 
     def update_progress(self, message: str):
-        """Update progress display (called from executor callback)."""
-        self.progress_var.set(message)
+        """Update progress display (called from executor callback); shown with the next output flush."""
+        self._progress_buffer.append(message)
+        self._schedule_output_flush()
+
+    def cleanup(self):
+        """Stop the running command so its worker can exit, and drop executions that have not started yet."""
+        if self.is_execution_running():
+            executor = self.call_callback('get_executor')
+            if executor:
+                executor.stop_execution()
+        self._execution_pool.shutdown(wait=False, cancel_futures=True)
 
     def append_output(self, text: str):
         """Append text to output display (called from executor callback)."""
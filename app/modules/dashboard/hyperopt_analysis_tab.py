@@ -7,9 +7,22 @@ Displays and manages hyperparameter optimization results.
 import tkinter as tk
 from tkinter import ttk
 import json
-from pathlib import Path
+import time
+from functools import lru_cache
 
-from .abstract_tab import AbstractTab
+from .abstract_tab import AbstractTab, _json_loads, _json_dumps_indented
+
+
+@lru_cache(maxsize=32)
+def _format_hyperopt_json(raw_json: str) -> str:
+    """Return the display text for a stored hyperopt_json blob, or the raw text if it is not valid JSON."""
+    try:
+        hyperopt_data = _json_loads(raw_json)
+    except (json.JSONDecodeError, TypeError):
+        return raw_json
+    if isinstance(hyperopt_data, dict) and 'raw_output' in hyperopt_data:
+        return hyperopt_data['raw_output']
+    return _json_dumps_indented(hyperopt_data)
 
 
 class HyperoptAnalysisTab(AbstractTab):
@@ -17,6 +30,15 @@ class HyperoptAnalysisTab(AbstractTab):
     A dedicated tab for analyzing hyperparameter optimization results.
     """
 
+    # Seconds a cached filter dropdown query stays valid
+    FILTER_CACHE_TTL = 30
+
+    # Delay used to coalesce rapid filter changes into one reload
+    RELOAD_DELAY_MS = 150
+
+    # Results queries keyed by (has_strategy, has_timeframe, has_session)
+    _results_queries = {}
+
     def __init__(self, parent, db_manager, logger):
         """Initialize the Hyperopt Analysis tab."""
         super().__init__(parent, db_manager, logger)
@@ -35,6 +57,21 @@ class HyperoptAnalysisTab(AbstractTab):
         self.config_text = None
         self.hyperopt_text = None
         self.metrics_labels = {}
+        self._metric_formatters = {}
+        self.details_notebook = None
+        self.config_frame = None
+        self.hyperopt_frame = None
+
+        # Details of the selected result; text tabs are filled when they are shown
+        self._pending_details = None
+        self._config_loaded_for = None
+        self._hyperopt_loaded_for = None
+
+        # Pending debounced reload of the results list
+        self._reload_after_id = None
+
+        # Cache for filter dropdown queries: (query, params) -> (timestamp, rows)
+        self._filter_cache = {}
 
     def create_tab(self) -> ttk.Frame:
         """Create the hyperopt analysis tab interface."""
@@ -59,17 +96,17 @@ class HyperoptAnalysisTab(AbstractTab):
         ttk.Label(filters_frame, text="Session:").pack(anchor='w')
         self.session_combo = ttk.Combobox(filters_frame, textvariable=self.session_var, width=25, state="readonly")
         self.session_combo.pack(fill='x', pady=(0, 10))
-        self.session_combo.bind('<<ComboboxSelected>>', lambda e: self.load_optimization_results())
+        self.session_combo.bind('<<ComboboxSelected>>', self._schedule_reload)
 
         ttk.Label(filters_frame, text="Strategy:").pack(anchor='w')
         self.strategy_combo = ttk.Combobox(filters_frame, textvariable=self.strategy_var, width=25, state="readonly")
         self.strategy_combo.pack(fill='x', pady=(0, 10))
-        self.strategy_combo.bind('<<ComboboxSelected>>', lambda e: self.load_optimization_results())
+        self.strategy_combo.bind('<<ComboboxSelected>>', self._schedule_reload)
 
         ttk.Label(filters_frame, text="Timeframe:").pack(anchor='w')
         self.timeframe_combo = ttk.Combobox(filters_frame, textvariable=self.timeframe_var, width=25, state="readonly")
         self.timeframe_combo.pack(fill='x', pady=(0, 10))
-        self.timeframe_combo.bind('<<ComboboxSelected>>', lambda e: self.load_optimization_results())
+        self.timeframe_combo.bind('<<ComboboxSelected>>', self._schedule_reload)
 
         ttk.Button(filters_frame, text="Refresh Data", command=self.refresh_data).pack(fill='x')
 
@@ -104,20 +141,21 @@ class HyperoptAnalysisTab(AbstractTab):
         details_frame = self.create_labeled_frame(parent, "Optimization Details")
         details_frame.pack(fill='both', expand=True)
 
-        details_notebook = ttk.Notebook(details_frame)
-        details_notebook.pack(fill='both', expand=True)
+        self.details_notebook = ttk.Notebook(details_frame)
+        self.details_notebook.pack(fill='both', expand=True)
 
-        metrics_frame = ttk.Frame(details_notebook)
-        config_frame = ttk.Frame(details_notebook)
-        hyperopt_frame = ttk.Frame(details_notebook)
+        metrics_frame = ttk.Frame(self.details_notebook)
+        self.config_frame = ttk.Frame(self.details_notebook)
+        self.hyperopt_frame = ttk.Frame(self.details_notebook)
 
-        details_notebook.add(metrics_frame, text="Metrics")
-        details_notebook.add(config_frame, text="Configuration")
-        details_notebook.add(hyperopt_frame, text="Hyperopt Log")
+        self.details_notebook.add(metrics_frame, text="Metrics")
+        self.details_notebook.add(self.config_frame, text="Configuration")
+        self.details_notebook.add(self.hyperopt_frame, text="Hyperopt Log")
+        self.details_notebook.bind('<<NotebookTabChanged>>', self._load_visible_details)
 
-        self.config_text = self.create_scrolled_text(config_frame, wrap=tk.WORD)
+        self.config_text = self.create_scrolled_text(self.config_frame, wrap=tk.WORD)
         self.config_text.pack(fill='both', expand=True)
-        self.hyperopt_text = self.create_scrolled_text(hyperopt_frame, wrap=tk.WORD, font=('Consolas', 10))
+        self.hyperopt_text = self.create_scrolled_text(self.hyperopt_frame, wrap=tk.WORD, font=('Consolas', 10))
         self.hyperopt_text.pack(fill='both', expand=True)
 
         self._create_metrics_display(metrics_frame)
@@ -137,6 +175,7 @@ class HyperoptAnalysisTab(AbstractTab):
         ]
 
         self.metrics_labels = {}
+        self._metric_formatters = {}
         for i, (label, key) in enumerate(metrics_info):
             ttk.Label(metrics_container, text=f"{label}:").grid(row=i % 6, column=(i // 6) * 2, sticky='w',
                                                                 padx=(0, 10), pady=2)
@@ -144,112 +183,201 @@ class HyperoptAnalysisTab(AbstractTab):
             value_label.grid(row=i % 6, column=(i // 6) * 2 + 1, sticky='w', padx=(0, 20), pady=2)
             self.metrics_labels[key] = value_label
 
+            # Pick the formatter once from the key name instead of on every selection
+            if key.endswith('_pct'):
+                self._metric_formatters[key] = self.format_percentage
+            elif key.endswith('_seconds'):
+                self._metric_formatters[key] = self._format_duration_metric
+            else:
+                self._metric_formatters[key] = self._format_plain_metric
+
+    def _format_duration_metric(self, value) -> str:
+        """Format a duration in seconds as minutes and seconds."""
+        return f"{value // 60}m {value % 60}s" if value else "N/A"
+
+    def _format_plain_metric(self, value) -> str:
+        """Format a metric without a unit."""
+        return self.format_number(value) if isinstance(value, float) else str(value or "N/A")
+
+    def _schedule_reload(self, event=None):
+        """Reload the results list shortly, replacing any reload that is still pending."""
+        if self._reload_after_id is not None:
+            self.frame.after_cancel(self._reload_after_id)
+        self._reload_after_id = self.frame.after(self.RELOAD_DELAY_MS, self._run_scheduled_reload)
+
+    def _run_scheduled_reload(self):
+        """Run the debounced results reload."""
+        self._reload_after_id = None
+        self.load_optimization_results()
+
     def _on_result_select(self, event=None):
         """Callback when a result is selected in the treeview."""
         selected_item = self.get_selected_treeview_item(self.results_tree)
         if selected_item:
             self.load_result_details(selected_item['values'][0])
 
-    def load_sessions(self):
-        """Load hyperopt sessions for the filter dropdown."""
+    def _cached_query(self, query: str, params: tuple = ()) -> list:
+        """Execute a filter query, reusing the result for up to FILTER_CACHE_TTL seconds."""
+        key = (query, params)
+        now = time.monotonic()
+        cached = self._filter_cache.get(key)
+        if cached and now - cached[0] < self.FILTER_CACHE_TTL:
+            return cached[1]
+
+        results = self.execute_database_query(query, params)
+        if results is not None:
+            self._filter_cache[key] = (now, results)
+        return results
+
+    def invalidate_cache(self):
+        """Drop cached filter queries so new results show up on the next refresh."""
+        self._filter_cache.clear()
+
+    def load_filter_options(self):
+        """Load sessions, strategies and timeframes for the filter dropdowns in one query."""
+        self._show_filter_options(self._fetch_filter_options())
+
+    def _fetch_filter_options(self) -> tuple:
+        """Query the session, strategy and timeframe dropdown options."""
         query = """
-            SELECT DISTINCT json_extract(session_info, '$.session_name') as session_name,
-            COUNT(*) as run_count, MIN(timestamp) as start_time
-            FROM hyperopt_results WHERE session_info IS NOT NULL
-            GROUP BY session_name ORDER BY start_time DESC
+            SELECT 'session' AS kind, session_name || ' (' || COUNT(*) || ' runs)' AS value,
+                   MIN(timestamp) AS start_time
+            FROM hyperopt_results WHERE session_name IS NOT NULL GROUP BY session_name
+            UNION ALL
+            SELECT DISTINCT 'strategy', strategy_name, NULL FROM hyperopt_results
+            UNION ALL
+            SELECT DISTINCT 'timeframe', timeframe, NULL FROM hyperopt_results WHERE timeframe IS NOT NULL
+            ORDER BY kind, start_time DESC, value
         """
-        results = self.execute_database_query(query)
+        results = self._cached_query(query)
+
+        # Session entries are labelled with their run count by the query
         session_options = ["All Sessions"]
-        if results:
-            session_options.extend([f"{row['session_name']} ({row['run_count']} runs)" for row in results])
-        self.populate_combobox(self.session_combo, session_options, "All Sessions")
+        strategy_options = ["All Strategies"]
+        timeframe_options = ["All Timeframes"]
+        options_by_kind = {'session': session_options, 'strategy': strategy_options, 'timeframe': timeframe_options}
+        for row in results or []:
+            options_by_kind[row['kind']].append(row['value'])
 
-    def load_strategies_filter(self):
-        """Load strategy names for the filter dropdown."""
-        query = "SELECT DISTINCT strategy_name FROM hyperopt_results ORDER BY strategy_name"
-        results = self.execute_database_query(query)
-        options = ["All Strategies"] + [row['strategy_name'] for row in results] if results else []
-        self.populate_combobox(self.strategy_combo, options, "All Strategies")
+        return session_options, strategy_options, timeframe_options
 
-    def load_timeframes(self):
-        """Load timeframes for the filter dropdown."""
-        query = "SELECT DISTINCT timeframe FROM hyperopt_results WHERE timeframe IS NOT NULL ORDER BY timeframe"
-        results = self.execute_database_query(query)
-        options = ["All Timeframes"] + [row['timeframe'] for row in results] if results else []
-        self.populate_combobox(self.timeframe_combo, options, "All Timeframes")
+    def _show_filter_options(self, options: tuple):
+        """Fill the filter dropdowns and reset them to their "All" entries."""
+        session_options, strategy_options, timeframe_options = options
+        self.populate_combobox(self.session_combo, session_options, "All Sessions")
+        self.populate_combobox(self.strategy_combo, strategy_options, "All Strategies")
+        self.populate_combobox(self.timeframe_combo, timeframe_options, "All Timeframes")
+
+    @classmethod
+    def _build_results_query(cls, has_strategy: bool, has_timeframe: bool, has_session: bool) -> str:
+        """Return the results query for a filter combination, building it only once."""
+        key = (has_strategy, has_timeframe, has_session)
+        query = cls._results_queries.get(key)
+        if query is None:
+            # Values are formatted for display by SQLite
+            query = f"""
+                SELECT id, strategy_name,
+                       {cls.sql_format_percentage('total_profit_pct')},
+                       COALESCE(NULLIF(total_trades, 0), 'N/A'),
+                       {cls.sql_format_percentage('win_rate')},
+                       COALESCE(NULLIF(substr(timestamp, 1, 10), ''), 'N/A')
+                FROM hyperopt_results WHERE status = 'completed'
+            """
+            if has_strategy:
+                query += " AND strategy_name = ?"
+            if has_timeframe:
+                query += " AND timeframe = ?"
+            if has_session:
+                query += " AND session_name = ?"
+            query += " ORDER BY total_profit_pct DESC LIMIT 100"
+            cls._results_queries[key] = query
+        return query
 
     def load_optimization_results(self):
         """Load and display hyperopt results based on current filters."""
-        query = "SELECT id, strategy_name, total_profit_pct, total_trades, win_rate, timestamp FROM hyperopt_results WHERE status = 'completed'"
-        params = []
-
-        if self.strategy_var.get() != "All Strategies":
-            query += " AND strategy_name = ?"
-            params.append(self.strategy_var.get())
-        if self.timeframe_var.get() != "All Timeframes":
-            query += " AND timeframe = ?"
-            params.append(self.timeframe_var.get())
-        if self.session_var.get() != "All Sessions":
-            session_name = self.session_var.get().split(' (')[0]
-            query += " AND json_extract(session_info, '$.session_name') = ?"
-            params.append(session_name)
+        self._show_results(self._fetch_results(
+            self.strategy_var.get(), self.timeframe_var.get(), self.session_var.get()
+        ))
 
-        query += " ORDER BY total_profit_pct DESC LIMIT 100"
-        results = self.execute_database_query(query, tuple(params))
+    def _fetch_results(self, strategy: str, timeframe: str, session: str):
+        """Query the hyperopt results matching the given filter values."""
+        params = []
 
+        has_strategy = strategy != "All Strategies"
+        if has_strategy:
+            params.append(strategy)
+        has_timeframe = timeframe != "All Timeframes"
+        if has_timeframe:
+            params.append(timeframe)
+        has_session = session != "All Sessions"
+        if has_session:
+            params.append(session.split(' (')[0])
+
+        query = self._build_results_query(has_strategy, has_timeframe, has_session)
+        return self.execute_database_query(query, tuple(params), as_tuples=True)
+
+    def _show_results(self, results):
+        """Fill the results list with the given hyperopt result rows."""
         self.clear_treeview(self.results_tree)
         if results:
-            for row in results:
-                self.results_tree.insert('', 'end', values=(
-                    row['id'], row['strategy_name'],
-                    self.format_percentage(row['total_profit_pct']),
-                    row['total_trades'] or "N/A",
-                    self.format_percentage(row['win_rate']),
-                    row['timestamp'][:10] if row['timestamp'] else "N/A"
-                ))
+            self.insert_treeview_rows(self.results_tree, results)
 
     def load_result_details(self, optimization_id: int):
         """Load the details for a specific hyperopt result."""
         query = "SELECT * FROM hyperopt_results WHERE id = ?"
         results = self.execute_database_query(query, (optimization_id,))
         if not results: return
-        result = results[0]
+        result = dict(results[0])
 
         # Update metrics
         for key, label in self.metrics_labels.items():
-            value = result[key] if key in result.keys() else None
-            if key.endswith('_pct'):
-                formatted = self.format_percentage(value)
-            elif key.endswith('_seconds'):
-                formatted = f"{value // 60}m {value % 60}s" if value else "N/A"
-            else:
-                formatted = self.format_number(value) if isinstance(value, float) else (value or "N/A")
-            label.config(text=str(formatted))
-
-        # Load config file content
-        self.config_text.delete(1.0, tk.END)
-        config_path = result['config_file_path']
-        if config_path and Path(config_path).exists():
-            config_data = self.load_json_file(config_path)
-            self.config_text.insert(1.0, json.dumps(config_data, indent=2) if config_data else "Failed to load config.")
+            label.config(text=self._metric_formatters[key](result.get(key)))
+
+        # The config and log tabs are filled when they become visible
+        self._pending_details = result
+        self._load_visible_details()
+
+    def _load_visible_details(self, event=None):
+        """Fill the currently shown details tab for the selected result, if not done yet."""
+        result = self._pending_details
+        if result is None:
+            return
+
+        current_tab = self.details_notebook.select()
+        if current_tab == str(self.config_frame) and self._config_loaded_for != result['id']:
+            self._show_config(result)
+            self._config_loaded_for = result['id']
+        elif current_tab == str(self.hyperopt_frame) and self._hyperopt_loaded_for != result['id']:
+            self._show_hyperopt_log(result)
+            self._hyperopt_loaded_for = result['id']
+
+    def _show_config(self, result):
+        """Show the config file of a hyperopt result."""
+        self.fill_text(self.config_text, self.load_config_text(result['config_file_path']))
+
+    def _show_hyperopt_log(self, result):
+        """Show the stored hyperopt output of a hyperopt result."""
+        if result.get('raw_output'):
+            self.fill_text(self.hyperopt_text, result['raw_output'])
+        elif result['hyperopt_json']:
+            self.fill_text(self.hyperopt_text, _format_hyperopt_json(result['hyperopt_json']))
         else:
-            self.config_text.insert(1.0, "Configuration file not found.")
-
-        # Load hyperopt log
-        self.hyperopt_text.delete(1.0, tk.END)
-        if result['hyperopt_json']:
-            try:
-                hyperopt_data = json.loads(result['hyperopt_json'])
-                raw_output = hyperopt_data.get('raw_output', json.dumps(hyperopt_data, indent=2))
-                self.hyperopt_text.insert(1.0, raw_output)
-            except (json.JSONDecodeError, TypeError):
-                self.hyperopt_text.insert(1.0, result['hyperopt_json'])  # Show raw text if not valid JSON
-        else:
-            self.hyperopt_text.insert(1.0, "Hyperopt log not found.")
+            self.fill_text(self.hyperopt_text, "Hyperopt log not found.")
+
+    def fetch_refresh_data(self) -> tuple:
+        """Run the queries behind refresh_data without touching any widgets."""
+        # Refreshing resets the filters to "All", so the results are queried unfiltered
+        return (self._fetch_filter_options(),
+                self._fetch_results("All Strategies", "All Timeframes", "All Sessions"))
+
+    def apply_refresh_data(self, data: tuple):
+        """Show the data returned by fetch_refresh_data."""
+        options, results = data
+        self._show_filter_options(options)
+        self._show_results(results)
 
     def refresh_data(self):
-        """Refresh all data displays in this tab."""
-        self.load_sessions()
-        self.load_strategies_filter()
-        self.load_timeframes()
-        self.load_optimization_results()
\ No newline at end of file
+        """Refresh all data displays in this tab, re-querying the filter options as well."""
+        # Runs written by the CLI or another process must show up on an explicit refresh
+        self.invalidate_cache()
+        self.apply_refresh_data(self.fetch_refresh_data())
\ No newline at end of file
@@ -4,12 +4,17 @@ Logs Tab
 Handles the logs viewing functionality of the dashboard.
 """
 
+import mmap
+import os
+import re
+import shutil
+import sys
+from itertools import groupby, islice
 import tkinter as tk
 from tkinter import ttk
 from pathlib import Path
 from datetime import datetime
 import threading
-import time
 
 from .abstract_tab import AbstractTab
 
@@ -19,6 +24,42 @@ class LogsTab(AbstractTab):
     Tab for viewing and managing application logs.
     """
 
+    # Maximum number of lines kept in the display while auto-refresh appends to it
+    MAX_DISPLAY_LINES = 20000
+
+    # Number of file lines rendered at once; earlier lines are rendered when scrolled to
+    RENDER_LINES = 2000
+
+    # Number of characters inserted into the display at a time while a loaded log file is shown
+    INSERT_BATCH_CHARS = 64 * 1024
+
+    # Block size used when copying part of a log file to save it
+    SAVE_CHUNK_SIZE = 1 << 20
+
+    # Log level tag names; interned so every detected level is one of these same objects
+    DEBUG, INFO, WARNING, ERROR, CRITICAL = (sys.intern(level) for level in
+                                             ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL'))
+
+    # Log level keywords, matched on the raw bytes of a line
+    _LEVEL_RE = re.compile(rb'\b(CRITICAL|ERROR|WARNING|WARN|DEBUG|INFO)\b', re.IGNORECASE)
+    _LEVEL_MAP = {
+        b'CRITICAL': CRITICAL,
+        b'ERROR': ERROR,
+        b'WARNING': WARNING,
+        b'WARN': WARNING,
+        b'DEBUG': DEBUG,
+        b'INFO': INFO,
+    }
+
+    # Per-level patterns used to skip lines that cannot match the level filter before detecting their level.
+    # INFO has none because lines without any level keyword default to INFO.
+    _LEVEL_PREFILTERS = {
+        'CRITICAL': re.compile(rb'\bCRITICAL\b', re.IGNORECASE),
+        'ERROR': re.compile(rb'\bERROR\b', re.IGNORECASE),
+        'WARNING': re.compile(rb'\bWARN(?:ING)?\b', re.IGNORECASE),
+        'DEBUG': re.compile(rb'\bDEBUG\b', re.IGNORECASE),
+    }
+
     def __init__(self, parent, db_manager, logger):
         """Initialize the Logs tab."""
         super().__init__(parent, db_manager, logger)
@@ -28,12 +69,36 @@ class LogsTab(AbstractTab):
         self.auto_refresh_var = tk.BooleanVar(value=False)
         self.refresh_interval_var = tk.StringVar(value="5")
         self.log_level_var = tk.StringVar(value="All")
+        self.load_mode_var = tk.StringVar(value="Tail")
+        self.wrap_lines_var = tk.BooleanVar(value=False)
         self.current_log_file = None
         self.auto_refresh_thread = None
-        self.stop_auto_refresh = False
+        self._stop_event = threading.Event()
 
-        # Available log files
+        # Available log files, cached by the logs directory's modification time
         self.log_files = []
+        self._logs_dir_mtime = None
+        self._logs_dir_cache = []
+
+        # Number of bytes loaded from the end of the file in "Tail" mode
+        self.tail_bytes = 512 * 1024
+
+        # Byte offset in the current log file up to which complete lines are displayed
+        self._last_offset = 0
+
+        # Whether the display ends with the file's unfinished last line, which is replaced once more is written
+        self._partial_line_shown = False
+
+        # (size, mtime_ns) of the current log file when it was last read
+        self._last_stat = None
+
+        # Incremented for each full load so that results of superseded loads are dropped
+        self._load_generation = 0
+
+        # Start offsets of the loaded lines and the index of the first one rendered
+        self._line_offsets = []
+        self._first_rendered = 0
+        self._render_pending = False
 
     def create_tab(self) -> ttk.Frame:
         """Create the logs tab."""
@@ -71,10 +136,20 @@ class LogsTab(AbstractTab):
         log_level_combo.pack(side='left', padx=(0, 5))
         log_level_combo.bind('<<ComboboxSelected>>', self._apply_log_filter)
 
+        # Load mode: only the end of the file, or all of it
+        ttk.Label(left_frame, text="Load:").pack(side='left', padx=(10, 5))
+        load_mode_combo = ttk.Combobox(left_frame, textvariable=self.load_mode_var, width=6, state="readonly")
+        load_mode_combo['values'] = ['Tail', 'Full']
+        load_mode_combo.pack(side='left', padx=(0, 5))
+        load_mode_combo.bind('<<ComboboxSelected>>', self._apply_log_filter)
+
         # Right side - Auto-refresh controls
         right_frame = ttk.Frame(toolbar_frame)
         right_frame.pack(side='right')
 
+        ttk.Checkbutton(right_frame, text="Wrap lines", variable=self.wrap_lines_var,
+                        command=self._toggle_wrap_lines).pack(side='left', padx=(0, 10))
+
         ttk.Checkbutton(right_frame, text="Auto-refresh", variable=self.auto_refresh_var,
                         command=self._toggle_auto_refresh).pack(side='left', padx=(0, 5))
 
@@ -88,20 +163,27 @@ class LogsTab(AbstractTab):
         display_frame = ttk.Frame(self.frame)
         display_frame.pack(fill='both', expand=True, padx=10, pady=(0, 10))
 
-        # Create scrolled text widget for logs
-        self.logs_text = self.create_scrolled_text(display_frame, wrap=tk.WORD, font=('Consolas', 9))
+        # Create scrolled text widget for logs; lines are not wrapped by default since
+        # wrapping long lines is slow, so a horizontal scrollbar is added
+        self.logs_text = self.create_scrolled_text(display_frame, wrap=tk.NONE, font=('Consolas', 9))
+        h_scrollbar = ttk.Scrollbar(display_frame, orient='horizontal', command=self.logs_text.xview)
+        self.logs_text.config(xscrollcommand=h_scrollbar.set)
+        h_scrollbar.pack(side='bottom', fill='x')
         self.logs_text.pack(fill='both', expand=True)
 
         # Configure text tags for different log levels
-        self.logs_text.tag_config('DEBUG', foreground='gray')
-        self.logs_text.tag_config('INFO', foreground='black')
-        self.logs_text.tag_config('WARNING', foreground='orange')
-        self.logs_text.tag_config('ERROR', foreground='red')
-        self.logs_text.tag_config('CRITICAL', foreground='red', background='yellow')
+        self.logs_text.tag_config(self.DEBUG, foreground='gray')
+        self.logs_text.tag_config(self.INFO, foreground='black')
+        self.logs_text.tag_config(self.WARNING, foreground='orange')
+        self.logs_text.tag_config(self.ERROR, foreground='red')
+        self.logs_text.tag_config(self.CRITICAL, foreground='red', background='yellow')
 
         # Make text read-only
         self.logs_text.config(state='disabled')
 
+        # Watch the scroll position to render earlier lines on demand
+        self.logs_text.config(yscrollcommand=self._on_logs_scroll)
+
     def _create_status_bar(self):
         """Create the status bar."""
         status_frame = ttk.Frame(self.frame)
@@ -128,20 +210,31 @@ class LogsTab(AbstractTab):
         """Discover available log files."""
         try:
             logs_dir = Path("logs")
-            if not logs_dir.exists():
+            try:
+                dir_mtime = logs_dir.stat().st_mtime_ns
+            except FileNotFoundError:
                 self.log_files = []
+                self._logs_dir_mtime = None
                 self.populate_combobox(self.log_file_combo, ["No log files found"])
                 return
 
-            # Find all log files
-            log_files = []
-            for pattern in ["*.log", "*.txt"]:
-                log_files.extend(logs_dir.glob(pattern))
+            # Files were not added, removed or renamed since the last scan
+            if dir_mtime == self._logs_dir_mtime:
+                self.log_files = self._logs_dir_cache
+                return
+
+            # Find all log files in a single directory pass
+            with os.scandir(logs_dir) as entries:
+                dated_files = [(entry.stat().st_mtime, Path(entry.path)) for entry in entries
+                               if entry.name.endswith(('.log', '.txt')) and entry.is_file()]
 
             # Sort by modification time (newest first)
-            log_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
+            dated_files.sort(key=lambda item: item[0], reverse=True)
+            log_files = [path for _, path in dated_files]
 
             self.log_files = log_files
+            self._logs_dir_mtime = dir_mtime
+            self._logs_dir_cache = log_files
 
             # Update combo box
             if log_files:
@@ -177,85 +270,330 @@ class LogsTab(AbstractTab):
         self._load_current_log()
 
     def _load_current_log(self):
-        """Load the currently selected log file."""
+        """Load the currently selected log file in a background thread."""
+        # Results of earlier loads that are still running are discarded
+        self._load_generation += 1
+
         if not self.current_log_file or not self.current_log_file.exists():
             self._clear_logs()
             self._update_status("No log file selected")
             return
 
-        try:
-            self._update_status("Loading log file...")
-
-            # Read the log file
-            with open(self.current_log_file, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+        self._update_status("Loading log file...")
 
-            # Update display
-            self._display_log_content(content)
+        tail = self.load_mode_var.get() == "Tail"
+        threading.Thread(
+            target=self._read_log_file,
+            args=(self._load_generation, self.current_log_file, tail, self.log_level_var.get()),
+            daemon=True
+        ).start()
 
-            # Update status
-            file_size = self.format_file_size(self.current_log_file.stat().st_size)
-            modified_time = datetime.fromtimestamp(self.current_log_file.stat().st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            self._update_status(f"Loaded: {self.current_log_file.name} ({file_size}) - Modified: {modified_time}")
+    def _read_log_file(self, generation: int, log_file: Path, tail: bool, level_filter: str):
+        """Read, index and tag a log file off the UI thread, then hand the result to the UI thread."""
+        try:
+            file_stat = log_file.stat()
+            size = file_stat.st_size
+
+            # In tail mode only the last tail_bytes of the file are shown
+            start = max(0, size - self.tail_bytes) if tail else 0
+
+            line_offsets = []
+            first_rendered = 0
+            chunks = []
+            partial_chunks = []
+            loaded_size = 0
+
+            # Map the log file instead of reading it into memory; empty files cannot be mapped
+            if size > 0:
+                with open(log_file, 'rb') as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    try:
+                        # Complete lines end at loaded_size; an unfinished last line after it is shown
+                        # separately and replaced by _append_new_lines once more of it is written
+                        loaded_size = mm.rfind(b'\n') + 1
+                        if loaded_size < len(mm):
+                            partial_chunks = self._build_log_chunks([mm[max(loaded_size, start):]], level_filter)
+
+                        if start > 0:
+                            # Skip the partial line at the start of the window without copying it
+                            newline = mm.find(b'\n', start, loaded_size)
+                            start = loaded_size if newline == -1 else newline + 1
+
+                        # Index the lines once; only the last RENDER_LINES of them are rendered now
+                        line_offsets = self._index_lines(mm, start, loaded_size)
+                        first_rendered = max(0, len(line_offsets) - self.RENDER_LINES)
+                        if line_offsets:
+                            mm.seek(line_offsets[first_rendered])
+                            raw_lines = islice(iter(mm.readline, b''), len(line_offsets) - first_rendered)
+                            chunks = self._build_log_chunks(raw_lines, level_filter)
+                    finally:
+                        mm.close()
+
+            self.frame.after(0, lambda: self._display_log_content(
+                generation, log_file, file_stat, start, line_offsets, first_rendered, loaded_size, chunks,
+                partial_chunks
+            ))
 
         except Exception as e:
-            self.logger.error(f"Error loading log file {self.current_log_file}: {e}")
-            self._update_status(f"Error loading log file: {e}", "red")
-            self.show_error("Error", f"Failed to load log file: {e}")
+            self.frame.after(0, lambda error=e: self._on_log_load_error(generation, log_file, error))
+
+    def _display_log_content(self, generation, log_file, file_stat, start, line_offsets,
+                             first_rendered, loaded_size, chunks, partial_chunks):
+        """Display a log file read by _read_log_file, unless a newer load has started since."""
+        if generation != self._load_generation:
+            return
+
+        self._line_offsets = line_offsets
+        self._first_rendered = first_rendered
+        self._last_offset = loaded_size
+        self._last_stat = (file_stat.st_size, file_stat.st_mtime_ns)
 
-    def _display_log_content(self, content: str):
-        """Display log content with syntax highlighting."""
         # Enable text widget for editing
         self.logs_text.config(state='normal')
 
         # Clear current content
         self.logs_text.delete(1.0, tk.END)
 
-        # Split content into lines
-        lines = content.split('\n')
+        # The unfinished last line goes in first; the complete lines are inserted before it
+        self._show_partial_line(partial_chunks)
+
+        # Disable text widget
+        self.logs_text.config(state='disabled')
+
+        # Insert the lines from the end backwards; earlier lines are rendered once they are all in
+        self._render_pending = True
+        self._insert_chunks_from_end(generation, chunks)
+
+        # Scroll to bottom
+        self.logs_text.see(tk.END)
+
+        # Update status
+        file_size = self.format_file_size(file_stat.st_size)
+        modified_time = datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
+        message = f"Loaded: {log_file.name} ({file_size}) - Modified: {modified_time}"
+        if start > 0:
+            message += f" - Showing last {self.tail_bytes // 1024} KB"
+        self._update_status(message)
+
+    def _insert_chunks_from_end(self, generation: int, chunks: list):
+        """
+        Insert loaded (log level, text) chunks at the top of the display, starting with the last one.
+
+        About INSERT_BATCH_CHARS characters are inserted at a time with the event loop running in
+        between, so the end of the log shows up at once and the UI stays responsive. Stops when
+        a newer load has started or the display was cleared.
+        """
+        if generation != self._load_generation:
+            return
+
+        self.logs_text.config(state='normal')
+        inserted = 0
+        while chunks and inserted < self.INSERT_BATCH_CHARS:
+            log_level, chunk = chunks.pop()
+            if log_level:
+                self.logs_text.insert('1.0', chunk, log_level)
+            else:
+                self.logs_text.insert('1.0', chunk)
+            inserted += len(chunk)
+        self.logs_text.config(state='disabled')
+        self._update_line_count()
+
+        if chunks:
+            self.frame.after(1, self._insert_chunks_from_end, generation, chunks)
+        else:
+            self._render_pending = False
+
+    def _on_log_load_error(self, generation: int, log_file: Path, error: Exception):
+        """Report a failed log file load, unless a newer load has started since."""
+        if generation != self._load_generation:
+            return
+
+        self.logger.error(f"Error loading log file {log_file}: {error}")
+        self._update_status(f"Error loading log file: {error}", "red")
+        self.show_error("Error", f"Failed to load log file: {error}")
+
+    def _index_lines(self, mm: mmap.mmap, start: int, end: int) -> list:
+        """Return the start offset of every line in the mapped file between start and end."""
+        offsets = []
+        position = start
+        while position < end:
+            offsets.append(position)
+            newline = mm.find(b'\n', position, end)
+            if newline == -1:
+                break
+            position = newline + 1
+        return offsets
+
+    def _on_logs_scroll(self, first, last):
+        """Update the scrollbar and render earlier lines once the top of the display is reached."""
+        self.logs_text.vbar.set(first, last)
+        if float(first) == 0.0 and self._first_rendered > 0 and not self._render_pending:
+            self._render_pending = True
+            self.frame.after_idle(self._render_earlier_lines)
+
+    def _render_earlier_lines(self):
+        """Render the block of lines before the first rendered line at the top of the display."""
+        self._render_pending = False
+        if not self._first_rendered or not self.current_log_file:
+            return
+
+        try:
+            # The file was truncated or rotated; the line index no longer applies
+            if self.current_log_file.stat().st_size < self._last_offset:
+                return
+
+            new_first = max(0, self._first_rendered - self.RENDER_LINES)
+
+            lines_before = int(self.logs_text.index('end-1c').split('.')[0])
+
+            self.logs_text.config(state='normal')
+            self.logs_text.mark_set('render_start', '1.0')
+            self.logs_text.mark_gravity('render_start', 'right')
+            with open(self.current_log_file, 'rb') as f:
+                f.seek(self._line_offsets[new_first])
+                self._insert_log_lines(islice(f, self._first_rendered - new_first), 'render_start')
+            self.logs_text.mark_unset('render_start')
+            self.logs_text.config(state='disabled')
+
+            self._first_rendered = new_first
+
+            # Keep the line that was at the top in view
+            added = int(self.logs_text.index('end-1c').split('.')[0]) - lines_before
+            self.logs_text.yview(f'{added + 1}.0')
+
+            self._update_line_count()
+
+        except Exception as e:
+            self.logger.error(f"Error rendering earlier lines of {self.current_log_file}: {e}")
+
+    def _insert_log_lines(self, raw_lines, index=tk.END):
+        """Insert raw log lines at index (the end by default), tagged by level and filtered."""
+        self._insert_log_chunks(self._build_log_chunks(raw_lines, self.log_level_var.get()), index)
+
+    def _insert_log_chunks(self, chunks, index=tk.END):
+        """Insert (log level, text) chunks at index; chunks without a level are inserted untagged."""
+        for log_level, chunk in chunks:
+            if log_level:
+                self.logs_text.insert(index, chunk, log_level)
+            else:
+                self.logs_text.insert(index, chunk)
+
+    def _build_log_chunks(self, raw_lines, level_filter: str) -> list:
+        """Join consecutive raw lines with the same level into (log level, text) chunks."""
+        # Each chunk is decoded once and goes into the widget with a single insert; this does not touch Tk
+        return [(log_level, (b'\n'.join(line for _, line in group) + b'\n').decode('utf-8', 'ignore'))
+                for log_level, group in groupby(self._tag_log_lines(raw_lines, level_filter),
+                                                key=lambda item: item[0])]
+
+    def _tag_log_lines(self, raw_lines, level_filter: str):
+        """Yield (log level, undecoded line without its ending) per line passing the level filter; blank lines get no level."""
+        prefilter = self._LEVEL_PREFILTERS.get(level_filter)
+        for raw_line in raw_lines:
+            if not raw_line.strip():
+                yield None, b''
+                continue
 
-        # Process each line and apply appropriate formatting
-        for line in lines:
-            if not line.strip():
-                self.logs_text.insert(tk.END, '\n')
+            # Lines without the filtered level's keyword are skipped without further work
+            if prefilter and not prefilter.search(raw_line):
                 continue
 
             # Determine log level
-            log_level = self._detect_log_level(line)
+            log_level = self._detect_log_level(raw_line)
 
             # Apply filter
-            if self.log_level_var.get() != "All" and log_level != self.log_level_var.get():
+            if level_filter != "All" and log_level != level_filter:
                 continue
 
-            # Insert line with appropriate tag
-            self.logs_text.insert(tk.END, line + '\n', log_level)
+            yield log_level, raw_line.rstrip(b'\r\n')
 
-        # Disable text widget
-        self.logs_text.config(state='disabled')
+    def _append_new_lines(self):
+        """Append lines written to the current log file since it was last read."""
+        if not self.current_log_file:
+            return
 
-        # Scroll to bottom
-        self.logs_text.see(tk.END)
+        try:
+            file_stat = self.current_log_file.stat()
 
-        # Update line count
-        line_count = len(self.logs_text.get(1.0, tk.END).split('\n')) - 1
+            # Nothing was written since the last read
+            if (file_stat.st_size, file_stat.st_mtime_ns) == self._last_stat:
+                return
+
+            size = file_stat.st_size
+
+            # The file was truncated or rotated; start over
+            if size < self._last_offset:
+                self._load_current_log()
+                return
+
+            self._last_stat = (size, file_stat.st_mtime_ns)
+            if size == self._last_offset:
+                return
+
+            # Stream the new lines from the file instead of reading the delta into one buffer
+            self.logs_text.config(state='normal')
+            if self._partial_line_shown:
+                # The unfinished last line is read again below, as far as it has been written by now
+                self.logs_text.delete('end-1c -1l linestart', 'end-1c')
+                self._partial_line_shown = False
+            with open(self.current_log_file, 'rb') as f:
+                f.seek(self._last_offset)
+                self._insert_log_lines(self._read_complete_lines(f))
+                f.seek(self._last_offset)
+                partial_line = f.read()
+            if partial_line:
+                self._show_partial_line(self._build_log_chunks([partial_line], self.log_level_var.get()))
+
+            # Keep the display from growing without bound
+            line_count = int(self.logs_text.index('end-1c').split('.')[0])
+            if line_count > self.MAX_DISPLAY_LINES:
+                self.logs_text.delete('1.0', f'{line_count - self.MAX_DISPLAY_LINES + 1}.0')
+                # Trimmed lines are not rendered back when scrolling up
+                self._first_rendered = 0
+
+            self.logs_text.config(state='disabled')
+            self.logs_text.see(tk.END)
+
+            self._update_line_count()
+
+        except FileNotFoundError:
+            return
+        except Exception as e:
+            self.logger.error(f"Error appending to log file {self.current_log_file}: {e}")
+            self._update_status(f"Error reading log file: {e}", "red")
+
+    def _read_complete_lines(self, f):
+        """Yield complete lines from f, advancing _last_offset past each one."""
+        for raw_line in f:
+            if not raw_line.endswith(b'\n'):
+                # Leave an unfinished last line for the next refresh
+                break
+            self._last_offset += len(raw_line)
+            yield raw_line
+
+    def _show_partial_line(self, chunks: list):
+        """Show the (log level, text) chunks of an unfinished last line at the end of the display."""
+        self._insert_log_chunks(chunks)
+        # A filtered out line is not shown, so there is nothing to replace later
+        self._partial_line_shown = bool(chunks)
+
+    def _update_line_count(self):
+        """Update the lines count label."""
+        line_count = int(self.logs_text.index('end-1c').split('.')[0])
         self.lines_label.config(text=f"Lines: {line_count}")
 
-    def _detect_log_level(self, line: str) -> str:
-        """Detect the log level of a line."""
-        line_upper = line.upper()
-
-        if 'CRITICAL' in line_upper:
-            return 'CRITICAL'
-        elif 'ERROR' in line_upper:
-            return 'ERROR'
-        elif 'WARNING' in line_upper or 'WARN' in line_upper:
-            return 'WARNING'
-        elif 'DEBUG' in line_upper:
-            return 'DEBUG'
-        elif 'INFO' in line_upper:
-            return 'INFO'
-        else:
-            return 'INFO'  # Default to INFO
+    def _detect_log_level(self, line_bytes: bytes) -> str:
+        """Detect the log level of a raw log line."""
+        match = self._LEVEL_RE.search(line_bytes)
+        if match:
+            keyword = match.group(1)
+            # Keywords are usually upper case already; only other spellings need upper()
+            level = self._LEVEL_MAP.get(keyword)
+            return level if level is not None else self._LEVEL_MAP[keyword.upper()]
+        return self.INFO  # Default to INFO
+
+    def _toggle_wrap_lines(self):
+        """Switch between unwrapped lines and wrapping at any character."""
+        self.logs_text.config(wrap=tk.CHAR if self.wrap_lines_var.get() else tk.NONE)
 
     def _apply_log_filter(self, event=None):
         """Apply log level filter to current display."""
@@ -264,15 +602,29 @@ class LogsTab(AbstractTab):
 
     def _clear_logs(self):
         """Clear the logs display."""
+        # Lines of a load still being inserted are dropped
+        self._load_generation += 1
+        self._render_pending = False
         self.logs_text.config(state='normal')
         self.logs_text.delete(1.0, tk.END)
         self.logs_text.config(state='disabled')
         self.lines_label.config(text="Lines: 0")
+        self._line_offsets = []
+        self._first_rendered = 0
+        self._partial_line_shown = False
 
     def _save_logs(self):
         """Save current logs to a file."""
-        content = self.logs_text.get(1.0, tk.END)
-        if not content.strip():
+        # Without a level filter the display shows the current file, or in tail mode its last part,
+        # so the bytes are copied from the file as is instead of re-encoding the display
+        copy_current_file = self.current_log_file is not None and self.log_level_var.get() == "All"
+        if copy_current_file:
+            has_logs = self.logs_text.compare('end-1c', '!=', '1.0')
+        else:
+            content = self.logs_text.get(1.0, tk.END)
+            has_logs = bool(content.strip())
+
+        if not has_logs:
             self.show_warning("Warning", "No logs to save!")
             return
 
@@ -284,14 +636,34 @@ class LogsTab(AbstractTab):
 
         if file_path:
             try:
-                with open(file_path, 'w') as f:
-                    f.write(content)
+                if copy_current_file and self.load_mode_var.get() == "Full":
+                    shutil.copyfile(self.current_log_file, file_path)
+                elif copy_current_file:
+                    self._copy_loaded_log_part(file_path)
+                else:
+                    with open(file_path, 'wb') as f:
+                        f.write(content.encode('utf-8'))
                 self.show_info("Success", "Logs saved successfully!")
                 self._update_status(f"Logs saved to: {Path(file_path).name}")
             except Exception as e:
                 self.logger.error(f"Error saving logs: {e}")
                 self.show_error("Error", f"Failed to save logs: {e}")
 
+    def _copy_loaded_log_part(self, file_path: str):
+        """Copy the part of the current log file that was loaded into the display to file_path."""
+        start = self._line_offsets[0] if self._line_offsets else 0
+        with open(self.current_log_file, 'rb') as source, open(file_path, 'wb') as target:
+            # A shown unfinished last line is copied as far as it has been written
+            end = os.fstat(source.fileno()).st_size if self._partial_line_shown else self._last_offset
+            remaining = end - start
+            source.seek(start)
+            while remaining > 0:
+                chunk = source.read(min(remaining, self.SAVE_CHUNK_SIZE))
+                if not chunk:
+                    break
+                target.write(chunk)
+                remaining -= len(chunk)
+
     def _toggle_auto_refresh(self):
         """Toggle auto-refresh functionality."""
         if self.auto_refresh_var.get():
@@ -306,7 +678,7 @@ class LogsTab(AbstractTab):
         if self.auto_refresh_thread and self.auto_refresh_thread.is_alive():
             return
 
-        self.stop_auto_refresh = False
+        self._stop_event.clear()
         self.auto_refresh_thread = threading.Thread(target=self._auto_refresh_worker, daemon=True)
         self.auto_refresh_thread.start()
         self._update_status("Auto-refresh started")
@@ -316,28 +688,21 @@ class LogsTab(AbstractTab):
         FIX: Safely stop the auto-refresh thread without updating the UI.
         The UI update is now handled in _toggle_auto_refresh.
         """
-        self.stop_auto_refresh = True
+        self._stop_event.set()
 
     def _auto_refresh_worker(self):
         """Worker thread for auto-refresh."""
-        while not self.stop_auto_refresh and self.auto_refresh_var.get():
-            try:
-                # Get refresh interval
-                interval = int(self.refresh_interval_var.get())
-
-                # Wait for the specified interval
-                for _ in range(interval * 10):  # Check every 0.1 seconds
-                    if self.stop_auto_refresh or not self.auto_refresh_var.get():
-                        return
-                    time.sleep(0.1)
+        try:
+            # wait() returns True as soon as the stop event is set
+            while not self._stop_event.wait(int(self.refresh_interval_var.get())):
+                if not self.auto_refresh_var.get():
+                    return
 
                 # Refresh logs in the main thread
-                if not self.stop_auto_refresh and self.auto_refresh_var.get():
-                    self.frame.after(0, self._load_current_log)
+                self.frame.after(0, self._append_new_lines)
 
-            except Exception as e:
-                self.logger.error(f"Error in auto-refresh worker: {e}")
-                break
+        except Exception as e:
+            self.logger.error(f"Error in auto-refresh worker: {e}")
 
     def _update_status(self, message: str, color: str = 'gray'):
         """Update the status label."""
@@ -6,6 +6,7 @@ This tab holds sub-tabs for Hyperopt and Backtest result analysis.
 
 import tkinter as tk
 from tkinter import ttk
+from concurrent.futures import ThreadPoolExecutor
 
 from .abstract_tab import AbstractTab
 from .hyperopt_analysis_tab import HyperoptAnalysisTab
@@ -17,33 +18,114 @@ class ResultsAnalysisTab(AbstractTab):
     A container tab that organizes results analysis into sub-tabs.
     """
 
+    # Sub-tab classes by name; each is built the first time its notebook tab is selected
+    SUB_TABS = {'hyperopt': HyperoptAnalysisTab, 'backtest': BacktestAnalysisTab}
+
+    # Number of sub-tab refreshes that query the database at the same time; one per sub-tab
+    REFRESH_WORKERS = 2
+
     def __init__(self, parent, db_manager, logger):
         """Initialize the container tab."""
         super().__init__(parent, db_manager, logger)
         self.hyperopt_tab: HyperoptAnalysisTab = None
         self.backtest_tab: BacktestAnalysisTab = None
 
+        # Number of sub-tab refreshes still running
+        self._refresh_in_flight = 0
+
+        # Sub-tab refreshes run on long-lived worker threads instead of a new thread each
+        self._refresh_pool = ThreadPoolExecutor(max_workers=self.REFRESH_WORKERS,
+                                                thread_name_prefix='results-refresh')
+
+        # Whether a refresh was requested while others were running; it runs once they are done
+        self._refresh_requested = False
+
+        # Sub-notebook, the placeholder frames the sub-tabs are built in, and which sub-tabs exist
+        self.notebook = None
+        self._placeholders = {}
+        self._built = {'hyperopt': False, 'backtest': False}
+
     def create_tab(self) -> ttk.Frame:
         """Create the main frame and the sub-notebook for analysis tabs."""
         self.frame = ttk.Frame(self.parent)
 
         # Create a notebook to hold the sub-tabs
-        notebook = ttk.Notebook(self.frame)
-        notebook.pack(fill='both', expand=True, padx=5, pady=5)
+        self.notebook = ttk.Notebook(self.frame)
+        self.notebook.pack(fill='both', expand=True, padx=5, pady=5)
 
-        # Create instances of the specialized tabs
-        self.hyperopt_tab = HyperoptAnalysisTab(notebook, self.db_manager, self.logger)
-        self.backtest_tab = BacktestAnalysisTab(notebook, self.db_manager, self.logger)
+        # Add placeholders; the specialized tabs are created inside them when first selected
+        self._placeholders = {name: ttk.Frame(self.notebook) for name in self.SUB_TABS}
+        self.notebook.add(self._placeholders['hyperopt'], text="Hyperopt Analysis")
+        self.notebook.add(self._placeholders['backtest'], text="Backtest Analysis")
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_sub_tab_changed)
 
-        # Add the specialized tabs to the notebook
-        notebook.add(self.hyperopt_tab.create_tab(), text="Hyperopt Analysis")
-        notebook.add(self.backtest_tab.create_tab(), text="Backtest Analysis")
+        # Build the initially shown sub-tab now; the dashboard's first refresh loads its data
+        self._build_selected_sub_tab()
 
         return self.frame
 
-    def refresh_data(self):
-        """Refresh the data in both the hyperopt and backtest sub-tabs."""
+    def _on_sub_tab_changed(self, event=None):
+        """Build a sub-tab on its first selection and load its data."""
+        tab = self._build_selected_sub_tab()
+        if tab:
+            self._refresh_in_flight += 1
+            self._refresh_pool.submit(self._fetch_sub_tab_data, tab)
+
+    def _build_selected_sub_tab(self):
+        """Create the selected sub-tab if it does not exist yet. Returns the new sub-tab, or None."""
+        selected = self.notebook.select()
+        for name, placeholder in self._placeholders.items():
+            if str(placeholder) == selected and not self._built[name]:
+                tab = self.SUB_TABS[name](placeholder, self.db_manager, self.logger)
+                tab.create_tab().pack(fill='both', expand=True)
+                setattr(self, f'{name}_tab', tab)
+                self._built[name] = True
+                return tab
+        return None
+
+    def invalidate_cache(self):
+        """Drop cached queries held by the sub-tabs."""
         if self.hyperopt_tab:
-            self.hyperopt_tab.refresh_data()
-        if self.backtest_tab:
-            self.backtest_tab.refresh_data()
\ No newline at end of file
+            self.hyperopt_tab.invalidate_cache()
+
+    def refresh_data(self) -> bool:
+        """
+        Refresh the data in the sub-tabs that have been built, querying them concurrently.
+
+        Returns:
+            bool: True if the refresh started now, False if it runs once the running refreshes are done
+        """
+        if self._refresh_in_flight:
+            self._refresh_requested = True
+            return False
+
+        sub_tabs = [tab for tab in (self.hyperopt_tab, self.backtest_tab) if tab]
+        self._refresh_in_flight = len(sub_tabs)
+        for tab in sub_tabs:
+            self._refresh_pool.submit(self._fetch_sub_tab_data, tab)
+        return True
+
+    def _fetch_sub_tab_data(self, tab):
+        """Run a sub-tab's refresh queries in a background thread and hand the result to the UI thread."""
+        try:
+            data = tab.fetch_refresh_data()
+        except Exception as e:
+            self.logger.error(f"Error refreshing results: {e}")
+            data = None
+        self.frame.after(0, lambda: self._apply_sub_tab_data(tab, data))
+
+    def _apply_sub_tab_data(self, tab, data):
+        """Show the data fetched for a sub-tab."""
+        self._refresh_in_flight -= 1
+        if data is not None:
+            tab.apply_refresh_data(data)
+
+        # The running fetches may have started before the requested refresh's data was written
+        if not self._refresh_in_flight and self._refresh_requested:
+            self._refresh_requested = False
+            self.invalidate_cache()
+            self.refresh_data()
+
+    def cleanup(self):
+        """Drop sub-tab refreshes that have not started yet and let the workers exit once idle."""
+        self._refresh_pool.shutdown(wait=False, cancel_futures=True)
@@ -6,10 +6,16 @@ with direct database integration using the simplified schema.
 """
 
 import os
+import codecs
 import json
+import locale
 import logging
+import shutil
+import signal
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Optional, Callable, Dict, Any
@@ -39,6 +45,15 @@ class FreqTradeExecutor:
     Handles hyperopt, backtest, and data download commands with simplified database integration.
     """
 
+    # Maximum number of bytes of command output read and passed on at once
+    OUTPUT_READ_SIZE = 64 * 1024
+
+    # Seconds a stopped command gets to exit before it is killed
+    STOP_GRACE_SECONDS = 2.0
+
+    # Maximum number of backtests a batch runs at once; each one is a FreqTrade process using about one core
+    BATCH_WORKERS = max(1, (os.cpu_count() or 1) - 1)
+
     def __init__(self, config: OptimizationConfig = None, logger: logging.Logger = None, db_manager: DatabaseManager = None):
         """
         Initialize the executor.
@@ -57,9 +72,17 @@ class FreqTradeExecutor:
 
         # Execution state
         self.current_process: Optional[subprocess.Popen] = None
+
+        # FreqTrade path the command environment was prepared for, whether its virtual
+        # environment exists, the environment itself and the executables resolved in it
+        self._command_env_cache: Optional[tuple] = None
         self.current_session_info: Dict[str, Any] = {}
+        self._session_lock = threading.Lock()
         self.is_running = False
 
+        # Executors running the backtests of the current batch, see batch_backtest_from_best_hyperopt
+        self._batch_workers: List['FreqTradeExecutor'] = []
+
         # Session info for tracking
         self.session_start_time = datetime.now()
 
@@ -111,28 +134,31 @@ class FreqTradeExecutor:
 
     def update_session_stats(self, success: bool = None):
         """Update session statistics."""
-        if success is not None:
-            self.current_session_info['strategies_processed'] = self.current_session_info.get('strategies_processed',
-                                                                                              0) + 1
-            if success:
-                self.current_session_info['strategies_successful'] = self.current_session_info.get(
-                    'strategies_successful', 0) + 1
-            else:
-                self.current_session_info['strategies_failed'] = self.current_session_info.get('strategies_failed',
-                                                                                               0) + 1
+        with self._session_lock:
+            if success is not None:
+                self.current_session_info['strategies_processed'] = self.current_session_info.get('strategies_processed',
+                                                                                                  0) + 1
+                if success:
+                    self.current_session_info['strategies_successful'] = self.current_session_info.get(
+                        'strategies_successful', 0) + 1
+                else:
+                    self.current_session_info['strategies_failed'] = self.current_session_info.get('strategies_failed',
+                                                                                                   0) + 1
 
-        # Update duration
-        if self.session_start_time:
-            duration = (datetime.now() - self.session_start_time).total_seconds()
-            self.current_session_info['duration_seconds'] = int(duration)
+            # Update duration
+            if self.session_start_time:
+                duration = (datetime.now() - self.session_start_time).total_seconds()
+                self.current_session_info['duration_seconds'] = int(duration)
 
-    def execute_command(self, command: List[str], timeout: int = 3600) -> ExecutionResult:
+    def execute_command(self, command: List[str], timeout: int = 3600, merge_stderr: bool = True) -> ExecutionResult:
         """
         Execute a FreqTrade command with proper environment setup.
 
         Args:
             command: Command to execute as list of strings
             timeout: Command timeout in seconds
+            merge_stderr: Stream stderr through stdout as it is produced. Otherwise both are still
+                passed on as they are produced, but stdout is returned without stderr mixed in.
 
         Returns:
             ExecutionResult object
@@ -156,85 +182,61 @@ class FreqTradeExecutor:
             self._notify_output(f"Command: {' '.join(command)}\n")
 
             # Setup environment
-            env = os.environ.copy()
+            command, env = self._prepare_command(command)
             cwd = self.config.freqtrade_path
 
-            # Build command with virtual environment activation
-            if os.name == 'nt':  # Windows
-                venv_activate = Path(self.config.freqtrade_path) / '.venv' / 'Scripts' / 'activate.bat'
-                if venv_activate.exists():
-                    full_command = f'call "{venv_activate}" && ' + ' '.join(command)
-                else:
-                    full_command = ' '.join(command)
-                    self._notify_output("Warning: Virtual environment not found\n")
-            else:  # Unix/Linux
-                venv_activate = Path(self.config.freqtrade_path) / '.venv' / 'bin' / 'activate'
-                if venv_activate.exists():
-                    full_command = f'bash -c "source {venv_activate} && {" ".join(command)}"'
-                else:
-                    full_command = ' '.join(command)
-                    self._notify_output("Warning: Virtual environment not found\n")
-
-            # Execute command
+            # Execute command without a shell; output is read from unbuffered byte pipes
+            # and passed on as soon as it is written. The command gets its own process
+            # group so stopping it also stops any processes it started.
+            if os.name == 'nt':
+                group_options = {'creationflags': subprocess.CREATE_NEW_PROCESS_GROUP}
+            else:
+                group_options = {'start_new_session': True}
             self.current_process = subprocess.Popen(
-                full_command,
-                shell=True,
+                command,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
+                stderr=subprocess.STDOUT if merge_stderr else subprocess.PIPE,
+                bufsize=0,
                 cwd=cwd,
-                env=env
+                env=env,
+                **group_options
             )
 
-            # Read output in real-time
-            stdout_lines = []
-            stderr_lines = []
-
-            while True:
-                # Check if process is still running
-                if self.current_process.poll() is not None:
-                    # Process finished, read remaining output
-                    remaining_stdout, remaining_stderr = self.current_process.communicate()
-                    if remaining_stdout:
-                        stdout_lines.append(remaining_stdout)
-                        self._notify_output(remaining_stdout)
-                    if remaining_stderr:
-                        stderr_lines.append(remaining_stderr)
-                        self._notify_output(remaining_stderr)
-                    break
-
-                # Read available output
-                try:
-                    import select
-                    ready, _, _ = select.select([self.current_process.stdout, self.current_process.stderr], [], [], 0.1)
-
-                    for stream in ready:
-                        line = stream.readline()
-                        if line:
-                            if stream == self.current_process.stdout:
-                                stdout_lines.append(line)
-                            else:
-                                stderr_lines.append(line)
-                            self._notify_output(line)
-
-                except ImportError:
-                    # Fallback for Windows (no select module)
-                    try:
-                        stdout, stderr = self.current_process.communicate(timeout=0.1)
-                        if stdout:
-                            stdout_lines.append(stdout)
-                            self._notify_output(stdout)
-                        if stderr:
-                            stderr_lines.append(stderr)
-                            self._notify_output(stderr)
-                        break
-                    except subprocess.TimeoutExpired:
-                        continue
+            # The output is read until the process closes it, so the timeout is enforced
+            # by terminating the process from a timer
+            timed_out = threading.Event()
+            process = self.current_process
+
+            def stop_on_timeout():
+                timed_out.set()
+                self._terminate_process(process)
+
+            timer = threading.Timer(timeout, stop_on_timeout)
+            timer.daemon = True
+            timer.start()
+            try:
+                # Separate stderr is read on its own thread so neither pipe can fill up and block the command
+                stderr_output = []
+                stderr_reader = None
+                if not merge_stderr:
+                    stderr_reader = threading.Thread(
+                        target=lambda: stderr_output.append(self._stream_output(process.stderr)),
+                        daemon=True
+                    )
+                    stderr_reader.start()
+
+                stdout = self._stream_output(process.stdout)
+                if stderr_reader:
+                    stderr_reader.join()
+                process.wait()
+            finally:
+                timer.cancel()
+            if timed_out.is_set():
+                raise subprocess.TimeoutExpired(command, timeout)
+            stderr = ''.join(stderr_output)
 
             # Get results
             return_code = self.current_process.returncode
-            stdout = ''.join(stdout_lines)
-            stderr = ''.join(stderr_lines)
             duration = int(time.time() - start_time)
 
             result = ExecutionResult(
@@ -255,7 +257,7 @@ class FreqTradeExecutor:
 
         except subprocess.TimeoutExpired:
             if self.current_process:
-                self.current_process.terminate()
+                self._terminate_process(self.current_process)
 
             duration = int(time.time() - start_time)
             result = ExecutionResult(
@@ -293,6 +295,40 @@ class FreqTradeExecutor:
             if self.completion_callback and result:
                 self.completion_callback(result)
 
+    def _stream_output(self, stream) -> str:
+        """
+        Pass the output of a process pipe on in the chunks it arrives in, until the process closes it.
+
+        Output is decoded and its newlines are translated like a text mode pipe would,
+        but without splitting it into lines first.
+
+        Returns:
+            str: The complete output
+        """
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(errors='replace')
+        # The pipe is unbuffered, so each read is a single read() of whatever is available
+        read = stream.read
+        chunks = []
+        carriage_return = False
+
+        while True:
+            data = read(self.OUTPUT_READ_SIZE)
+            text = decoder.decode(data, final=not data)
+
+            # A carriage return at the end of a chunk may be the first half of a \r\n pair
+            if carriage_return:
+                text = '\r' + text
+            carriage_return = bool(data) and text.endswith('\r')
+            if carriage_return:
+                text = text[:-1]
+
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+            if text:
+                chunks.append(text)
+                self._notify_output(text)
+            if not data:
+                return ''.join(chunks)
+
     def run_hyperopt(self, strategy_name: str, config_file: str = None,
                      timerange: str = None, epochs: int = None,
                      spaces: List[str] = None, hyperopt_loss: str = None,
@@ -338,9 +374,11 @@ class FreqTradeExecutor:
             # Remove stale lock file
             if self.config:
                 lock_file_path = Path(self.config.freqtrade_path) / "user_data" / "hyperopt.lock"
-                if lock_file_path.exists():
-                    self.logger.warning(f"Removed stale lock file: {lock_file_path}")
+                try:
                     lock_file_path.unlink()
+                    self.logger.warning(f"Removed stale lock file: {lock_file_path}")
+                except FileNotFoundError:
+                    pass
 
             # Build command
             command = [
@@ -424,8 +462,8 @@ class FreqTradeExecutor:
                 "--timerange", timerange
             ]
 
-            # Execute backtest
-            result = self.execute_command(command)
+            # Execute backtest; stderr is kept out of the output that is parsed and stored
+            result = self.execute_command(command, merge_stderr=False)
 
             if result.success:
                 # Parse and save backtest results
@@ -472,15 +510,9 @@ class FreqTradeExecutor:
         """
         try:
             # Get hyperopt result from database
-            hyperopt_results = self.db_manager.get_best_hyperopt_strategies(limit=1000)  # Get all to find by ID
-            hyperopt_result = None
-
-            for result in hyperopt_results:
-                if result['id'] == hyperopt_id:
-                    hyperopt_result = result
-                    break
+            hyperopt_result = self.db_manager.get_hyperopt_by_id(hyperopt_id)
 
-            if not hyperopt_result:
+            if not hyperopt_result or hyperopt_result['status'] != 'completed':
                 error_msg = f"Hyperopt result with ID {hyperopt_id} not found"
                 self.logger.error(error_msg)
                 return ExecutionResult(
@@ -547,20 +579,27 @@ class FreqTradeExecutor:
                 self.logger.warning("No hyperopt strategies found for batch backtesting")
                 return []
 
-            results = []
-            self.logger.info(f"Starting batch backtest for {len(best_strategies)} strategies")
+            results = [None] * len(best_strategies)
+            workers = min(len(best_strategies), self.BATCH_WORKERS)
+            self.logger.info(f"Starting batch backtest for {len(best_strategies)} strategies ({workers} at once)")
 
-            for i, strategy in enumerate(best_strategies, 1):
-                self.logger.info(
-                    f"Backtesting {i}/{len(best_strategies)}: {strategy['strategy_name']} (ID {strategy['id']})")
+            # Each backtest runs in its own executor, so their processes can run side by side
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='batch-backtest') as pool:
+                futures = {}
+                for i, strategy in enumerate(best_strategies):
+                    self.logger.info(
+                        f"Queueing backtest {i + 1}/{len(best_strategies)}: {strategy['strategy_name']} (ID {strategy['id']})")
+                    futures[pool.submit(self._run_batch_backtest, strategy['id'])] = i
 
-                result = self.run_strategy_backtest_from_hyperopt(strategy['id'])
-                results.append(result)
+                for future in as_completed(futures):
+                    i = futures[future]
+                    strategy = best_strategies[i]
+                    result = results[i] = future.result()
 
-                if result.success:
-                    self.logger.info(f"✓ Backtest completed for {strategy['strategy_name']}")
-                else:
-                    self.logger.error(f"✗ Backtest failed for {strategy['strategy_name']}: {result.error_message}")
+                    if result.success:
+                        self.logger.info(f"✓ Backtest completed for {strategy['strategy_name']}")
+                    else:
+                        self.logger.error(f"✗ Backtest failed for {strategy['strategy_name']}: {result.error_message}")
 
             successful = sum(1 for r in results if r.success)
             self.logger.info(f"Batch backtest completed: {successful}/{len(results)} successful")
@@ -572,6 +611,24 @@ class FreqTradeExecutor:
             self.logger.error(error_msg)
             return []
 
+    def _run_batch_backtest(self, hyperopt_id: int) -> ExecutionResult:
+        """
+        Run one backtest of a batch in a separate executor sharing this executor's
+        session, callbacks and command environment.
+        """
+        worker = FreqTradeExecutor(self.config, self.logger, self.db_manager)
+        worker.set_callbacks(self.progress_callback, self.output_callback, self.completion_callback)
+        worker.current_session_info = self.current_session_info
+        worker.session_start_time = self.session_start_time
+        worker._session_lock = self._session_lock
+        worker._command_env_cache = self._command_env_cache
+
+        self._batch_workers.append(worker)
+        try:
+            return worker.run_strategy_backtest_from_hyperopt(hyperopt_id)
+        finally:
+            self._batch_workers.remove(worker)
+
     def download_data(self, exchange: str, pairs: List[str], timeframes: List[str],
                       timerange: str = None, days: int = None) -> ExecutionResult:
         """
@@ -644,11 +701,60 @@ class FreqTradeExecutor:
                 error_message=error_msg
             )
 
+    def _prepare_command(self, command: List[str]) -> tuple[List[str], Dict[str, str]]:
+        """
+        Get the command and environment to run a FreqTrade command inside its virtual environment.
+
+        The environment gets the same variables activating the virtual environment would set,
+        and the executable is resolved against its PATH, so no shell is needed. FreqTrade itself
+        is run as a module of the virtual environment's Python, so no launcher process sits
+        between the executor and FreqTrade. The environment and resolved executables are
+        prepared once per FreqTrade path and reused by later commands.
+        """
+        freqtrade_path = self.config.freqtrade_path
+        cache = self._command_env_cache
+        if cache is None or cache[0] != freqtrade_path:
+            env = os.environ.copy()
+
+            venv_dir = Path(freqtrade_path) / '.venv'
+            bin_dir = venv_dir / ('Scripts' if os.name == 'nt' else 'bin')
+            venv_python = bin_dir / ('python.exe' if os.name == 'nt' else 'python')
+            venv_exists = bin_dir.exists()
+            executables = {}
+            if venv_exists:
+                env['VIRTUAL_ENV'] = str(venv_dir)
+                env['PATH'] = str(bin_dir) + os.pathsep + env.get('PATH', '')
+                env.pop('PYTHONHOME', None)
+                if venv_python.exists():
+                    executables['python'] = str(venv_python)
+
+            cache = self._command_env_cache = (freqtrade_path, venv_exists, env, executables)
+
+        _, venv_exists, env, executables = cache
+        if not venv_exists:
+            self._notify_output("Warning: Virtual environment not found\n")
+
+        name = command[0]
+        if name == 'freqtrade' and 'python' in executables:
+            return [executables['python'], '-m', 'freqtrade', *command[1:]], env
+
+        if name not in executables:
+            executables[name] = shutil.which(name, path=env.get('PATH'))
+        executable = executables[name]
+        if executable:
+            command = [executable, *command[1:]]
+
+        return command, env
+
     def stop_execution(self) -> bool:
-        """Stop the current execution."""
+        """Stop the current execution, including the backtests of a running batch."""
+        stopped = [worker.stop_execution() for worker in list(self._batch_workers)]
+        if any(stopped):
+            return True
+
         if self.current_process and self.is_running:
             try:
-                self.current_process.terminate()
+                self._terminate_process(self.current_process)
                 self.logger.info("Execution stopped by user")
                 self._notify_progress("Execution stopped")
                 return True
@@ -657,6 +763,36 @@ class FreqTradeExecutor:
                 return False
         return False
 
+    def _terminate_process(self, process: subprocess.Popen):
+        """
+        Ask a command's process group to exit, and kill it if it is still running
+        STOP_GRACE_SECONDS later. Returns without waiting.
+        """
+        if process.poll() is not None:
+            return
+
+        if os.name == 'nt':
+            process.send_signal(signal.CTRL_BREAK_EVENT)
+        else:
+            try:
+                os.killpg(process.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                return
+
+        def kill_if_running():
+            if process.poll() is None:
+                if os.name == 'nt':
+                    process.kill()
+                else:
+                    try:
+                        os.killpg(process.pid, signal.SIGKILL)
+                    except ProcessLookupError:
+                        pass
+
+        timer = threading.Timer(self.STOP_GRACE_SECONDS, kill_if_running)
+        timer.daemon = True
+        timer.start()
+
     def get_session_summary(self) -> Dict[str, Any]:
         """Get current session summary."""
         self.update_session_stats()  # Update duration
@@ -665,7 +801,8 @@ class FreqTradeExecutor:
     def _get_hyperopt_results(self) -> ExecutionResult:
         """Get hyperopt results using hyperopt-show command."""
         command = ["freqtrade", "hyperopt-show", "-n", "1", "--print-json"]
-        return self.execute_command(command, timeout=60)
+        # The JSON on stdout is parsed, so log lines on stderr must stay out of it
+        return self.execute_command(command, timeout=60, merge_stderr=False)
 
     def _save_hyperopt_results_to_db(self, strategy_name: str, hyperopt_output: str,
                                      config_file: str, optimization_duration: int,
@@ -9,7 +9,6 @@ import json
 import sqlite3
 from pathlib import Path
 from typing import Optional
-from tabulate import tabulate
 from results_database_manager import DatabaseManager
 
 
@@ -21,6 +20,13 @@ class SimplifiedResultsAnalyzer:
     def __init__(self, db_path: str = "freqtrade_results.db"):
         self.db_manager = DatabaseManager(db_path)
 
+    @staticmethod
+    def _print_table(table_data: list, headers: list) -> None:
+        """Print rows as a grid table."""
+        # tabulate takes a while to import and is only needed once a table is printed
+        from tabulate import tabulate
+        print(tabulate(table_data, headers=headers, tablefmt='grid'))
+
     def show_best_hyperopt_strategies(self, limit: int = 10, timeframe: Optional[str] = None,
                                       min_trades: int = 10) -> None:
         """Show the best performing hyperopt strategies."""
@@ -28,7 +34,7 @@ class SimplifiedResultsAnalyzer:
         print("=" * 100)
 
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
+            with self.db_manager.read() as conn:
                 query = """
                     SELECT strategy_name, total_profit_pct, total_trades, win_rate, 
                            avg_profit_pct, max_drawdown_pct, sharpe_ratio, timeframe, 
@@ -74,7 +80,7 @@ class SimplifiedResultsAnalyzer:
                 headers = ['Strategy', 'Profit', 'Trades', 'Win Rate', 'Avg Profit',
                            'Drawdown', 'Sharpe', 'Timeframe', 'Date', 'Run', 'Epochs', 'Loss Func']
 
-                print(tabulate(table_data, headers=headers, tablefmt='grid'))
+                self._print_table(table_data, headers)
 
         except Exception as e:
             print(f"Error retrieving best hyperopt strategies: {e}")
@@ -86,7 +92,7 @@ class SimplifiedResultsAnalyzer:
         print("=" * 100)
 
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
+            with self.db_manager.read() as conn:
                 query = """
                     SELECT b.strategy_name, b.total_profit_pct, b.total_trades, b.win_rate, 
                            b.avg_profit_pct, b.max_drawdown_pct, b.sharpe_ratio, b.timeframe, 
@@ -138,7 +144,7 @@ class SimplifiedResultsAnalyzer:
                            'Drawdown', 'Sharpe', 'Timeframe', 'Date', 'Avg Duration',
                            'Opt Profit', 'Gap']
 
-                print(tabulate(table_data, headers=headers, tablefmt='grid'))
+                self._print_table(table_data, headers)
 
         except Exception as e:
             print(f"Error retrieving best backtest strategies: {e}")
@@ -182,7 +188,7 @@ class SimplifiedResultsAnalyzer:
             headers = ['Strategy', 'Opt Profit', 'BT Profit', 'Gap', 'Opt Trades',
                        'BT Trades', 'Opt Sharpe', 'BT Sharpe', 'Opt Date', 'BT Date', 'Status']
 
-            print(tabulate(table_data, headers=headers, tablefmt='grid'))
+            self._print_table(table_data, headers)
 
             # Summary statistics
             tested_strategies = [row for row in comparison_data if row['backtest_id']]
@@ -210,7 +216,7 @@ class SimplifiedResultsAnalyzer:
         print("=" * 120)
 
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
+            with self.db_manager.read() as conn:
                 conn.row_factory = sqlite3.Row
 
                 # Get all optimizations and their corresponding backtests for this strategy
@@ -263,7 +269,7 @@ class SimplifiedResultsAnalyzer:
                 headers = ['H_ID', 'Run', 'H_Profit', 'B_Profit', 'Gap', 'H_Trades',
                            'B_Trades', 'H_Sharpe', 'B_Sharpe', 'H_Date', 'B_Date', 'Epochs', 'Status']
 
-                print(tabulate(table_data, headers=headers, tablefmt='grid'))
+                self._print_table(table_data, headers)
 
                 # Show recommendations
                 tested_runs = [row for row in results if row['backtest_id']]
@@ -316,7 +322,7 @@ class SimplifiedResultsAnalyzer:
 
             headers = ['Type', 'ID', 'Timestamp', 'Profit', 'Trades', 'Sharpe', 'Run/Link', 'Details']
 
-            print(tabulate(table_data, headers=headers, tablefmt='grid'))
+            self._print_table(table_data, headers)
 
             # Performance summary
             hyperopt_results = [row for row in timeline_data if row['type'] == 'hyperopt']
@@ -435,7 +441,7 @@ class SimplifiedResultsAnalyzer:
         print("=" * 100)
 
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
+            with self.db_manager.read() as conn:
                 conn.row_factory = sqlite3.Row
 
                 cursor = conn.execute("""
@@ -468,7 +474,7 @@ class SimplifiedResultsAnalyzer:
                     ])
 
                 headers = ['ID', 'Strategy', 'Profit', 'Trades', 'Win Rate', 'Sharpe', 'Date', 'Run']
-                print(tabulate(table_data, headers=headers, tablefmt='grid'))
+                self._print_table(table_data, headers)
 
                 print(f"\n💡 RECOMMENDATION:")
                 print(f"Run backtests for these strategies using:")
@@ -491,7 +497,7 @@ class SimplifiedResultsAnalyzer:
 
         # Show best backtest details if available
         try:
-            with sqlite3.connect(self.db_manager.db_path) as conn:
+            with self.db_manager.read() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute("""
                     SELECT * FROM backtest_results 
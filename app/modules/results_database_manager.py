@@ -7,6 +7,8 @@ Structured to separate hyperopt runs and backtest runs into dedicated tables.
 import sqlite3
 import json
 import logging
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
@@ -91,12 +93,65 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
+
+        # One long-lived connection shared by all writers; the lock serializes its use across threads
+        self._conn = self._open_connection()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._lock = threading.RLock()
+
+        # Read-only connections, one per thread; in WAL mode they read without waiting for each other or the writer
+        self._local = threading.local()
+
         self._init_database()
 
+    def _open_connection(self) -> sqlite3.Connection:
+        """Open a connection to the database with the shared settings."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")
+        # Map up to 256 MB of the database so repeated reads skip read() syscalls
+        conn.execute("PRAGMA mmap_size=268435456")
+        return conn
+
+    @contextmanager
+    def connect(self):
+        """
+        Use the shared write connection.
+
+        Works like ``with sqlite3.connect(...) as conn``: the block runs in a
+        transaction that is committed on success and rolled back on error.
+        Callers may set ``conn.row_factory``; it is reset afterwards.
+        """
+        with self._lock:
+            try:
+                with self._conn:
+                    yield self._conn
+            finally:
+                self._conn.row_factory = None
+
+    @contextmanager
+    def read(self):
+        """
+        Use the calling thread's read-only connection, opening it on first use.
+
+        Each statement sees the data committed when it starts.
+        Callers may set ``conn.row_factory``; it is reset afterwards.
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._open_connection()
+            conn.execute("PRAGMA query_only=ON")
+            self._local.conn = conn
+        try:
+            yield conn
+        finally:
+            conn.row_factory = None
+
     def _init_database(self) -> None:
         """Initialize the database with the simplified two-table schema."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 # Enable foreign keys
                 conn.execute("PRAGMA foreign_keys = ON")
 
@@ -154,6 +209,7 @@ class DatabaseManager:
 
                         -- Meta Information
                         optimization_duration_seconds INTEGER,
+                        session_name VARCHAR(100),  -- Copied from session_info for indexed filtering
                         session_info TEXT  -- JSON with session metadata
                     )
                 """)
@@ -218,15 +274,33 @@ class DatabaseManager:
                     )
                 """)
 
+                # Cache of data file summaries shown in the dashboard's data tab
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS data_file_cache (
+                        path TEXT PRIMARY KEY,
+                        mtime REAL,
+                        size INTEGER,
+                        start_date VARCHAR(20),
+                        end_date VARCHAR(20),
+                        record_count INTEGER
+                    )
+                """)
+
+                # Add columns introduced after the initial schema
+                self._migrate_columns(conn)
+
                 # Create indexes for better performance
                 indexes = [
                     # Hyperopt indexes
+                    "CREATE INDEX IF NOT EXISTS idx_hyperopt_status_profit ON hyperopt_results(status, total_profit_pct DESC)",
+                    "CREATE INDEX IF NOT EXISTS idx_hyperopt_session ON hyperopt_results(session_name)",
                     "CREATE INDEX IF NOT EXISTS idx_hyperopt_strategy_profit ON hyperopt_results(strategy_name, total_profit_pct)",
                     "CREATE INDEX IF NOT EXISTS idx_hyperopt_timeframe_profit ON hyperopt_results(timeframe, total_profit_pct)",
                     "CREATE INDEX IF NOT EXISTS idx_hyperopt_timestamp ON hyperopt_results(timestamp)",
                     "CREATE INDEX IF NOT EXISTS idx_hyperopt_status ON hyperopt_results(status)",
 
                     # Backtest indexes
+                    "CREATE INDEX IF NOT EXISTS idx_backtest_status_profit ON backtest_results(status, total_profit_pct DESC)",
                     "CREATE INDEX IF NOT EXISTS idx_backtest_strategy_profit ON backtest_results(strategy_name, total_profit_pct)",
                     "CREATE INDEX IF NOT EXISTS idx_backtest_timeframe_profit ON backtest_results(timeframe, total_profit_pct)",
                     "CREATE INDEX IF NOT EXISTS idx_backtest_timestamp ON backtest_results(timestamp)",
@@ -244,6 +318,18 @@ class DatabaseManager:
             self.logger.error(f"Failed to initialize database: {e}")
             raise
 
+    def _migrate_columns(self, conn: sqlite3.Connection) -> None:
+        """Add columns that were introduced after the initial schema to existing databases."""
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(hyperopt_results)")}
+        if 'session_name' not in columns:
+            conn.execute("ALTER TABLE hyperopt_results ADD COLUMN session_name VARCHAR(100)")
+            conn.execute("""
+                UPDATE hyperopt_results
+                SET session_name = json_extract(session_info, '$.session_name')
+                WHERE session_info IS NOT NULL
+            """)
+            self.logger.info("Added session_name column to hyperopt_results")
+
     def save_hyperopt_result(self, result: HyperoptResult, session_info: Optional[Dict] = None) -> int:
         """Save hyperopt result to database."""
         try:
@@ -268,7 +354,7 @@ class DatabaseManager:
                 json.dump(result.hyperopt_json_data, f, indent=2)
 
             # Insert into database
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.execute("""
                     INSERT INTO hyperopt_results (
                         strategy_name, max_open_trades, timeframe, stake_amount, stake_currency,
@@ -276,9 +362,9 @@ class DatabaseManager:
                         run_number, total_profit_pct, total_profit_abs, total_trades, win_rate, 
                         avg_profit_pct, max_drawdown_pct, sharpe_ratio, calmar_ratio, sortino_ratio, 
                         profit_factor, expectancy, winning_trades, losing_trades, draw_trades,
-                        config_file_path, hyperopt_result_file_path, config_json, hyperopt_json,
-                        optimization_duration_seconds, session_info
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        config_file_path, hyperopt_result_file_path, config_json, hyperopt_json, raw_output,
+                        optimization_duration_seconds, session_name, session_info
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     result.strategy_name, result.max_open_trades, result.timeframe,
                     result.stake_amount, result.stake_currency, result.timerange,
@@ -294,7 +380,11 @@ class DatabaseManager:
                     result.hyperopt_json_data.get('draw_trades', 0),
                     str(config_path), str(hyperopt_path),
                     json.dumps(result.config_data), json.dumps(result.hyperopt_json_data),
-                    result.optimization_duration, json.dumps(session_info) if session_info else None
+                    # Stored separately so the dashboard can show it without parsing hyperopt_json
+                    result.hyperopt_json_data.get('raw_output'),
+                    result.optimization_duration,
+                    session_info.get('session_name') if session_info else None,
+                    json.dumps(session_info) if session_info else None
                 ))
 
                 hyperopt_id = cursor.lastrowid
@@ -318,8 +408,12 @@ class DatabaseManager:
             config_dir.mkdir(parents=True, exist_ok=True)
             backtest_dir.mkdir(parents=True, exist_ok=True)
 
-            config_filename = f"{timestamp}_{result.strategy_name}_backtest_config.json"
-            backtest_filename = f"{timestamp}_{result.strategy_name}_backtest_results.json"
+            # Backtests of the same strategy can run side by side; the hyperopt run keeps their files apart
+            name = f"{timestamp}_{result.strategy_name}"
+            if result.hyperopt_id is not None:
+                name += f"_hyperopt{result.hyperopt_id}"
+            config_filename = f"{name}_backtest_config.json"
+            backtest_filename = f"{name}_backtest_results.json"
 
             config_path = config_dir / config_filename
             backtest_path = backtest_dir / backtest_filename
@@ -331,7 +425,7 @@ class DatabaseManager:
                 json.dump(result.backtest_results, f, indent=2)
 
             # Insert into database
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.execute("""
                     INSERT INTO backtest_results (
                         strategy_name, max_open_trades, timeframe, stake_amount, stake_currency,
@@ -384,7 +478,7 @@ class DatabaseManager:
             query += " ORDER BY total_profit_pct DESC LIMIT ?"
             params.append(limit)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(query, params)
                 results = [dict(row) for row in cursor.fetchall()]
@@ -411,7 +505,7 @@ class DatabaseManager:
             query += " ORDER BY total_profit_pct DESC LIMIT ?"
             params.append(limit)
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(query, params)
                 results = [dict(row) for row in cursor.fetchall()]
@@ -458,7 +552,7 @@ class DatabaseManager:
 
             query += " ORDER BY ABS(h.total_profit_pct - COALESCE(b.total_profit_pct, 0)) DESC"
 
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(query, params)
                 results = [dict(row) for row in cursor.fetchall()]
@@ -472,7 +566,7 @@ class DatabaseManager:
     def get_strategy_timeline(self, strategy_name: str) -> List[Dict]:
         """Get performance timeline for a specific strategy across optimizations and backtests."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read() as conn:
                 conn.row_factory = sqlite3.Row
 
                 # Get combined timeline
@@ -502,10 +596,26 @@ class DatabaseManager:
             self.logger.error(f"Failed to get strategy timeline: {e}")
             return []
 
+    def get_hyperopt_by_id(self, hyperopt_id: int) -> Optional[Dict]:
+        """Get a single hyperopt result by its ID."""
+        try:
+            with self.read() as conn:
+                conn.row_factory = sqlite3.Row
+                cursor = conn.execute("""
+                    SELECT * FROM hyperopt_results WHERE id = ? LIMIT 1
+                """, (hyperopt_id,))
+
+                row = cursor.fetchone()
+                return dict(row) if row else None
+
+        except Exception as e:
+            self.logger.error(f"Failed to get hyperopt result {hyperopt_id}: {e}")
+            return None
+
     def get_hyperopt_json_result(self, hyperopt_id: int) -> Optional[Dict]:
         """Get hyperopt JSON result for a specific hyperopt run."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read() as conn:
                 cursor = conn.execute("""
                     SELECT hyperopt_json FROM hyperopt_results WHERE id = ?
                 """, (hyperopt_id,))
@@ -522,7 +632,7 @@ class DatabaseManager:
     def get_backtest_trades_from_json(self, backtest_id: int) -> List[Dict]:
         """Get individual trades from backtest JSON data."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read() as conn:
                 cursor = conn.execute("""
                     SELECT trades_json FROM backtest_results WHERE id = ?
                 """, (backtest_id,))
@@ -539,7 +649,7 @@ class DatabaseManager:
     def save_backtest_trades_json(self, backtest_id: int, trades: List[Dict]) -> None:
         """Save individual trade records as JSON for detailed analysis."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 conn.execute("""
                     UPDATE backtest_results 
                     SET trades_json = ?
@@ -552,10 +662,37 @@ class DatabaseManager:
         except Exception as e:
             self.logger.error(f"Failed to save backtest trades JSON: {e}")
 
+    def get_data_file_summaries(self) -> Dict[str, tuple]:
+        """Get all cached data file summaries as {path: (mtime, size, start_date, end_date, record_count)}."""
+        try:
+            with self.read() as conn:
+                cursor = conn.execute("""
+                    SELECT path, mtime, size, start_date, end_date, record_count FROM data_file_cache
+                """)
+                return {row[0]: row[1:] for row in cursor}
+
+        except Exception as e:
+            self.logger.error(f"Failed to get data file summaries: {e}")
+            return {}
+
+    def save_data_file_summaries(self, summaries: List[tuple]) -> None:
+        """Store data file summaries as (path, mtime, size, start_date, end_date, record_count) in one transaction."""
+        try:
+            with self.connect() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO data_file_cache (path, mtime, size, start_date, end_date, record_count)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, summaries)
+
+                conn.commit()
+
+        except Exception as e:
+            self.logger.error(f"Failed to save data file summaries: {e}")
+
     def get_stats_summary(self) -> Dict[str, Any]:
         """Get overall database statistics."""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.read() as conn:
                 # Hyperopt stats
                 cursor = conn.execute("""
                     SELECT 
@@ -782,7 +919,7 @@ class DatabaseManager:
         Migrate data from the old complex schema to the new simplified schema.
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 # Check if old tables exist
                 cursor = conn.execute("""
                     SELECT name FROM sqlite_master 